@@ -37,3 +37,14 @@ def celery_config():
 @pytest.fixture(autouse=True)
 def enable_db_access_for_all_tests(db):
     pass
+
+
+@pytest.fixture(autouse=True)
+def skip_postgres_tests_on_other_backends(request):
+    """Skip tests marked ``postgres`` unless the test database is PostgreSQL."""
+    if request.node.get_closest_marker("postgres") is None:
+        return
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        pytest.skip("needs PostgreSQL")
@@ -189,7 +189,7 @@ class TrackedContractAdmin(AdminAuditMixin, admin.ModelAdmin):
             _event_count=Count("events", distinct=True)
         ).select_related("owner")
 
-    @admin.display(description="Events")
+    @admin.display(description="Events", ordering="_event_count")
     def event_count(self, obj):
         """Use annotated count to avoid N+1 queries."""
         return getattr(obj, "_event_count", 0)
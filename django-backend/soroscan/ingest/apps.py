@@ -5,3 +5,9 @@ class IngestConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "soroscan.ingest"
     verbose_name = "SoroScan Ingest"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .services.timeline import warm_timezone_cache
+
+        warm_timezone_cache()
@@ -63,6 +63,27 @@ def invalidate_event_count_cache(contract_id: str) -> None:
     cache.delete(key)
 
 
+CONTRACT_ACTIVE_TTL = 60
+
+
+def contract_active_cache_key(contract_id: str) -> str:
+    """Return the cache key holding whether a contract exists and is active."""
+    return f"soroscan:contract_active:{contract_id}"
+
+
+def invalidate_contract_active_cache(contract_id: str) -> None:
+    """Drop the cached active flag for a contract."""
+    cache.delete(contract_active_cache_key(contract_id))
+
+
+# ``(watermark, through_id)`` from the last ContractEventHourly refresh: the
+# end (exclusive) of the hours timelines read from it, and the last event id
+# it counts. Expires if refreshes stop, so timelines fall back to raw events.
+HOURLY_AGGREGATE_WATERMARK_KEY = "soroscan:contract_event_hourly:watermark"
+HOURLY_AGGREGATE_WATERMARK_TTL = 3600
+
+
+
 DECODED_PAYLOAD_TTL = 86_400  # 24 hours
 
 
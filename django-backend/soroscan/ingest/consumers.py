@@ -1,15 +1,67 @@
 """
 WebSocket consumers for real-time event streaming.
 """
-import json
+import hashlib
 import logging
+import re
+from urllib.parse import parse_qs
 
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.core.cache import cache
 
+from .cache_utils import CONTRACT_ACTIVE_TTL, contract_active_cache_key
 from .models import TrackedContract
 
 logger = logging.getLogger(__name__)
 
+# Channel layer group names are limited to 100 ASCII alphanumerics, hyphens,
+# underscores or periods; event types that don't fit are hashed.
+_GROUP_SAFE_RE = re.compile(r"^[A-Za-z0-9_.-]{1,32}$")
+
+
+def event_group_name(contract_id: str, event_type: str | None = None) -> str:
+    """
+    Return the channel layer group for a contract's events.
+
+    With ``event_type`` set the group only receives events of that type, so
+    filtered subscribers never see traffic they would discard.
+    """
+    if not event_type:
+        return f"events_{contract_id}"
+    if not _GROUP_SAFE_RE.match(event_type):
+        event_type = hashlib.blake2b(event_type.encode(), digest_size=16).hexdigest()
+    return f"events_{contract_id}_{event_type}"
+
+
+def encode_event(event_data: dict) -> str:
+    """
+    Serialize a broadcast event to the JSON text sent to WebSocket clients.
+
+    orjson rejects integers that do not fit in 64 bits, such as Soroban
+    i128/u128 values; those are passed through as pre-rendered fragments so
+    every message comes out of the same encoder in the same format.
+    """
+    try:
+        return orjson.dumps(event_data).decode()
+    except orjson.JSONEncodeError:
+        return orjson.dumps(_fragment_wide_ints(event_data)).decode()
+
+
+# orjson serializes integers in [-2**63, 2**64 - 1].
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def _fragment_wide_ints(value):
+    if isinstance(value, dict):
+        return {key: _fragment_wide_ints(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_fragment_wide_ints(item) for item in value]
+    if isinstance(value, int) and not _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX:
+        return orjson.Fragment(str(value))
+    return value
+
 
 class EventConsumer(AsyncWebsocketConsumer):
     """
@@ -21,11 +73,12 @@ class EventConsumer(AsyncWebsocketConsumer):
 
     async def connect(self):
         self.contract_id = self.scope["url_route"]["kwargs"]["contract_id"]
-        self.event_type = self.scope["query_string"].decode().split("event_type=")[-1] if b"event_type=" in self.scope["query_string"] else None
+        query = parse_qs(self.scope["query_string"].decode())
+        self.event_type = query.get("event_type", [None])[0]
 
         try:
-            contract = await self.get_contract(self.contract_id)
-            if not contract:
+            is_active = await self.contract_is_active(self.contract_id)
+            if not is_active:
                 await self.close(code=4004)
                 return
         except Exception as e:
@@ -33,7 +86,7 @@ class EventConsumer(AsyncWebsocketConsumer):
             await self.close(code=4004)
             return
 
-        self.group_name = f"events_{self.contract_id}"
+        self.group_name = event_group_name(self.contract_id, self.event_type)
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
 
@@ -51,26 +104,35 @@ class EventConsumer(AsyncWebsocketConsumer):
     async def contract_event(self, event):
         """
         Handler for 'contract_event' messages sent to the group.
-        """
-        event_data = event["data"]
 
-        if self.event_type and event_data.get("event_type") != self.event_type:
-            return
-
-        await self.send(text_data=json.dumps(event_data))
+        Event-type filtering happens in the group name, so every message
+        delivered here is forwarded. Producers ship the JSON pre-encoded in
+        ``text``; ``data`` is only encoded here as a fallback.
+        """
+        text = event.get("text")
+        if text is None:
+            text = encode_event(event["data"])
+        await self.send(text_data=text)
 
     @staticmethod
-    async def get_contract(contract_id):
+    async def contract_is_active(contract_id):
         """
         Validate that the contract exists and is active.
+
+        The result is cached briefly so dashboards reconnecting to the same
+        contract skip the database round trip; saves invalidate the entry.
         """
         from channels.db import database_sync_to_async
 
+        key = contract_active_cache_key(contract_id)
+        cached = await cache.aget(key)
+        if cached is not None:
+            return cached
+
         @database_sync_to_async
-        def _get_contract():
-            try:
-                return TrackedContract.objects.get(contract_id=contract_id, is_active=True)
-            except TrackedContract.DoesNotExist:
-                return None
+        def _exists():
+            return TrackedContract.objects.filter(contract_id=contract_id, is_active=True).exists()
 
-        return await _get_contract()
+        is_active = await _exists()
+        await cache.aset(key, is_active, timeout=CONTRACT_ACTIVE_TTL)
+        return is_active
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.10 on 2026-10-15 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0032_apikey_team_alter_contractmetadata_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contractevent",
+            index=models.Index(
+                fields=["contract", "id"], name="ingest_cont_contrac_c44dfb_idx"
+            ),
+        ),
+    ]
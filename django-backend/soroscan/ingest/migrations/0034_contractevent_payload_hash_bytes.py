@@ -0,0 +1,93 @@
+"""
+Migration: store ContractEvent.payload_hash as 32 raw bytes instead of 64-char hex.
+
+On PostgreSQL the column is converted in place with ``decode(..., 'hex')``.
+Legacy values that are not whole-byte hex (the column used to accept any
+text) would abort that cast, so they are first recomputed from the payload
+the same way ``ContractEvent.save`` does, or cleared when there is no payload.
+The ``varchar_pattern_ops`` index Django creates for indexed CharFields cannot
+exist on a ``bytea`` column, so it is dropped first (and recreated on reverse).
+Other backends (e.g. SQLite used in test environments) are dynamically typed
+and need no database change.
+"""
+import hashlib
+
+from django.db import migrations
+
+import soroscan.ingest.models
+
+
+def _like_index_name(schema_editor, table):
+    return schema_editor._create_index_name(table, ["payload_hash"], suffix="_like")
+
+
+def _rehash_non_hex(ContractEvent, using):
+    invalid = (
+        ContractEvent.objects.using(using)
+        .exclude(payload_hash__regex=r"^([0-9a-fA-F]{2})*$")
+        .only("id", "payload")
+    )
+    pending = []
+    for event in invalid.iterator(chunk_size=2000):
+        event.payload_hash = (
+            hashlib.sha256(str(event.payload).encode("utf-8")).hexdigest() if event.payload else ""
+        )
+        pending.append(event)
+        if len(pending) >= 2000:
+            ContractEvent.objects.using(using).bulk_update(pending, ["payload_hash"])
+            pending = []
+    if pending:
+        ContractEvent.objects.using(using).bulk_update(pending, ["payload_hash"])
+
+
+def _payload_hash_to_bytes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    _rehash_non_hex(ContractEvent, schema_editor.connection.alias)
+    table = ContractEvent._meta.db_table
+    quote = schema_editor.quote_name
+    schema_editor.execute(f"DROP INDEX IF EXISTS {quote(_like_index_name(schema_editor, table))}")
+    schema_editor.execute(
+        f"ALTER TABLE {quote(table)} ALTER COLUMN payload_hash TYPE bytea "
+        "USING decode(payload_hash, 'hex')"
+    )
+
+
+def _payload_hash_to_hex(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("ingest", "ContractEvent")._meta.db_table
+    quote = schema_editor.quote_name
+    schema_editor.execute(
+        f"ALTER TABLE {quote(table)} ALTER COLUMN payload_hash TYPE varchar(64) "
+        "USING encode(payload_hash, 'hex')"
+    )
+    schema_editor.execute(
+        f"CREATE INDEX {quote(_like_index_name(schema_editor, table))} "
+        f"ON {quote(table)} (payload_hash varchar_pattern_ops)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0033_contractevent_contract_id_idx"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="contractevent",
+                    name="payload_hash",
+                    field=soroscan.ingest.models.HexDigestField(
+                        db_index=True, help_text="SHA-256 hash of the payload", max_length=64
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(_payload_hash_to_bytes, _payload_hash_to_hex),
+            ],
+        ),
+    ]
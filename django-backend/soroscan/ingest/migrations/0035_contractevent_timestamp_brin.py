@@ -0,0 +1,41 @@
+"""
+Migration: BRIN index on ContractEvent.timestamp.
+
+Events are appended in roughly timestamp order, so a BRIN index prunes wide
+since/until range scans from a structure orders of magnitude smaller than a
+B-tree. The existing B-tree on timestamp is kept because it still serves
+``ORDER BY timestamp DESC LIMIT n`` lookups, which BRIN cannot. BRIN requires
+PostgreSQL, so on other backends (e.g. SQLite used in test environments) the
+index is skipped.
+"""
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import migrations
+
+
+def _brin_index():
+    return BrinIndex(fields=["timestamp"], name="ingest_cont_ts_brin", pages_per_range=32)
+
+
+def _apply_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    schema_editor.add_index(ContractEvent, _brin_index())
+
+
+def _remove_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    schema_editor.remove_index(ContractEvent, _brin_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0034_contractevent_payload_hash_bytes"),
+    ]
+
+    operations = [
+        migrations.RunPython(_apply_brin_index, _remove_brin_index, elidable=True),
+    ]
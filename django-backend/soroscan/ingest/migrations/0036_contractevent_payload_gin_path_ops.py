@@ -0,0 +1,46 @@
+"""
+Migration: rebuild the ContractEvent.payload GIN index with ``jsonb_path_ops``.
+
+Nothing queries payload key existence (``?``/``has_key``), which is the only
+thing the default ``jsonb_ops`` class from migration 0009 adds; for ``@>``
+containment ``jsonb_path_ops`` is roughly half the size and faster. GIN
+requires PostgreSQL, so on other backends (e.g. SQLite used in test
+environments) this migration is a no-op.
+"""
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+
+def _default_ops_index():
+    return GinIndex(fields=["payload"], name="ingest_contractevent_payload_gin")
+
+
+def _path_ops_index():
+    return GinIndex(fields=["payload"], opclasses=["jsonb_path_ops"], name="ingest_cont_payload_gin")
+
+
+def _apply_path_ops_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    schema_editor.remove_index(ContractEvent, _default_ops_index())
+    schema_editor.add_index(ContractEvent, _path_ops_index())
+
+
+def _restore_default_ops_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    schema_editor.remove_index(ContractEvent, _path_ops_index())
+    schema_editor.add_index(ContractEvent, _default_ops_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0035_contractevent_timestamp_brin"),
+    ]
+
+    operations = [
+        migrations.RunPython(_apply_path_ops_index, _restore_default_ops_index, elidable=True),
+    ]
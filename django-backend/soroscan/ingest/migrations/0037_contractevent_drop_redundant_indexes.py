@@ -0,0 +1,54 @@
+"""
+Migration: drop ContractEvent indexes that duplicate other indexes.
+
+- ``ledger``, ``signature_status`` and ``invocation`` each had both a field
+  index and an identical ``Meta.indexes`` entry.
+- ``(contract, ledger, event_index)`` duplicated the unique constraint's index.
+- The ``contract`` foreign key index is a prefix of every composite index.
+- ``event_type`` alone is low-cardinality; contract-scoped filters use
+  ``(contract, event_type, timestamp)``.
+"""
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0036_contractevent_payload_gin_path_ops"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="contractevent",
+            name="ingest_cont_ledger_dde0a1_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="contractevent",
+            name="ingest_cont_contrac_c5f862_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="contractevent",
+            name="ingest_cont_invocat_123230_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="contractevent",
+            name="ingest_cont_signatu_39e92a_idx",
+        ),
+        migrations.AlterField(
+            model_name="contractevent",
+            name="contract",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="The contract that emitted this event",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="events",
+                to="ingest.trackedcontract",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contractevent",
+            name="event_type",
+            field=models.CharField(help_text="Event type/name (e.g., 'swap', 'transfer')", max_length=100),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+Migration: replace the ContractEvent.tx_hash B-tree index with a hash index.
+
+tx_hash is only ever looked up by equality, which a hash index serves at
+roughly half the size of a B-tree over 64-char hex strings. Hash indexes are
+created on PostgreSQL only; other backends (e.g. SQLite used in test
+environments) simply drop the B-tree.
+"""
+from django.contrib.postgres.indexes import HashIndex
+from django.db import migrations
+
+
+def _hash_index():
+    return HashIndex(fields=["tx_hash"], name="ingest_cont_tx_hash_hash")
+
+
+def _apply_hash_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    schema_editor.add_index(ContractEvent, _hash_index())
+
+
+def _remove_hash_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ContractEvent = apps.get_model("ingest", "ContractEvent")
+    schema_editor.remove_index(ContractEvent, _hash_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0037_contractevent_drop_redundant_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="contractevent",
+            name="ingest_cont_tx_hash_24128c_idx",
+        ),
+        migrations.RunPython(_apply_hash_index, _remove_hash_index, elidable=True),
+    ]
@@ -0,0 +1,46 @@
+"""
+Migration: hourly event-count rollup table backing ContractEventHourly.
+
+The table is created empty; the ``refresh_contract_event_hourly`` task fills
+it on its first run and afterwards only recounts the hours touched by new
+events.
+"""
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0038_contractevent_tx_hash_hash_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContractEventHourly",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "contract", "bucket", "event_type",
+                        blank=True, editable=False, primary_key=True, serialize=False,
+                    ),
+                ),
+                (
+                    "contract",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="ingest.trackedcontract",
+                    ),
+                ),
+                ("bucket", models.DateTimeField(help_text="Start of the UTC hour")),
+                ("event_type", models.CharField(max_length=100)),
+                ("event_count", models.BigIntegerField()),
+            ],
+            options={
+                "db_table": "ingest_contractevent_hourly",
+            },
+        ),
+    ]
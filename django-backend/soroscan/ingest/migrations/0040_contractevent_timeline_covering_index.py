@@ -0,0 +1,30 @@
+"""
+Migration: replace the ContractEvent ``(contract, timestamp)`` index with
+``(contract, -timestamp, event_type)``.
+
+Timeline queries filter by contract and a timestamp range and group by
+event_type. With event_type in the index, the count-only path can be served
+by an index-only scan, and the newest-first order matches how events are
+read. The new index keeps the same leading columns, so it also serves every
+query the old one did. Range pruning across contracts stays with the BRIN
+index from migration 0035.
+"""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingest", "0039_contracteventhourly"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contractevent",
+            index=models.Index(fields=["contract", "-timestamp", "event_type"], name="ingest_cont_contrac_42aaa7_idx"),
+        ),
+        migrations.RemoveIndex(
+            model_name="contractevent",
+            name="ingest_cont_contrac_3666e0_idx",
+        ),
+    ]
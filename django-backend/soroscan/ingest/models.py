@@ -6,7 +6,7 @@ import secrets
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator
 from django.db import models
 from django.utils.text import slugify
 
@@ -468,6 +468,47 @@ class ContractSigningKey(models.Model):
         return f"SigningKey({self.contract.contract_id[:8]}..., {self.algorithm})"
 
 
+# Whole bytes of hex only: ``bytes.fromhex`` also skips whitespace, which
+# would not survive the round trip back to text.
+validate_hex_digest = RegexValidator(
+    r"\A(?:[0-9a-fA-F]{2})*\Z",
+    message="Enter a hex-encoded digest with an even number of hex digits.",
+    code="invalid_hex_digest",
+)
+
+
+class HexDigestField(models.CharField):
+    """
+    Hash digest exposed as a lowercase hex string but stored as raw bytes.
+
+    Halves the column and index width compared to storing the hex text while
+    keeping the hex representation everywhere in Python, forms and APIs.
+    Values must pass :data:`validate_hex_digest`; callers writing in bulk
+    should validate rows first, since a bad value fails the whole statement.
+    """
+
+    default_validators = [validate_hex_digest]
+
+    def db_type(self, connection):
+        return connection.data_types["BinaryField"]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None or isinstance(value, str):
+            return value
+        return bytes(value).hex()
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None:
+            return None
+        try:
+            validate_hex_digest(value)
+        except ValidationError as err:
+            raise ValueError(f"{self.name} must be a hex-encoded digest") from err
+        return connection.Database.Binary(bytes.fromhex(value))
+
+
 class ContractEvent(models.Model):
     """
     Individual events emitted by tracked contracts.
@@ -477,11 +518,12 @@ class ContractEvent(models.Model):
         TrackedContract,
         on_delete=models.CASCADE,
         related_name="events",
+        # Every composite index below leads with contract.
+        db_index=False,
         help_text="The contract that emitted this event",
     )
     event_type = models.CharField(
         max_length=100,
-        db_index=True,
         help_text="Event type/name (e.g., 'swap', 'transfer')",
     )
     schema_version = models.PositiveIntegerField(
@@ -500,7 +542,7 @@ class ContractEvent(models.Model):
         help_text="Result of schema validation",
     )
     payload = models.JSONField(help_text="Decoded event payload")
-    payload_hash = models.CharField(
+    payload_hash = HexDigestField(
         max_length=64,
         db_index=True,
         help_text="SHA-256 hash of the payload",
@@ -556,12 +598,12 @@ class ContractEvent(models.Model):
         ordering = ["-timestamp"]
         indexes = [
             models.Index(fields=["contract", "event_type", "timestamp"]),
-            models.Index(fields=["contract", "timestamp"]),
-            models.Index(fields=["ledger"]),
-            models.Index(fields=["tx_hash"]),
-            models.Index(fields=["contract", "ledger", "event_index"]),
-            models.Index(fields=["invocation"]),
-            models.Index(fields=["signature_status"]),
+            # Covers timeline range scans: newest-first within a contract,
+            # with event_type available without visiting the heap.
+            models.Index(fields=["contract", "-timestamp", "event_type"]),
+            models.Index(fields=["contract", "id"]),
+            # tx_hash is only ever matched exactly; PostgreSQL gets a hash
+            # index for it in migration 0038.
         ]
         constraints = [
             models.UniqueConstraint(
@@ -581,6 +623,30 @@ class ContractEvent(models.Model):
         super().save(*args, **kwargs)
 
 
+class ContractEventHourly(models.Model):
+    """
+    Hourly (UTC) event counts per contract and event type.
+
+    Maintained incrementally by the ``refresh_contract_event_hourly`` task,
+    which recounts only the hours holding events added since its last run.
+    """
+
+    pk = models.CompositePrimaryKey("contract", "bucket", "event_type")
+    contract = models.ForeignKey(
+        TrackedContract,
+        on_delete=models.CASCADE,
+        related_name="+",
+        # The primary key leads with contract.
+        db_index=False,
+    )
+    bucket = models.DateTimeField(help_text="Start of the UTC hour")
+    event_type = models.CharField(max_length=100)
+    event_count = models.BigIntegerField()
+
+    class Meta:
+        db_table = "ingest_contractevent_hourly"
+
+
 class WebhookSubscription(models.Model):
     """
     Webhook subscriptions for push notifications on specific events.
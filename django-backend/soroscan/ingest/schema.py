@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import json
 from datetime import datetime
 from enum import Enum
 from typing import AsyncGenerator, List, Optional
@@ -10,10 +11,13 @@ from typing import AsyncGenerator, List, Optional
 import strawberry
 import strawberry_django
 from channels.layers import get_channel_layer
+from django.db import connection
 from django.db.models import Case, Count, IntegerField, Q, Value, When
 from django.utils import timezone
 from strawberry import auto
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.types import Info
+from strawberry.types.nodes import SelectedField
 
 from .cache_utils import get_or_set_json, query_cache_ttl, stable_cache_key
 from .models import (
@@ -46,6 +50,74 @@ def _get_authenticated_user(info: Info):
     return None
 
 
+# Large ContractEvent columns that are only loaded when the query selects them.
+# ``raw_xdr`` is not exposed by EventType at all, so it is always deferred.
+_EVENT_OPTIONAL_COLUMNS = {
+    "payload": "payload",
+    "decodedPayload": "decoded_payload",
+}
+
+
+def _flatten_selections(selections):
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            # Inline fragments and fragment spreads carry their own selections.
+            yield from _flatten_selections(selection.selections)
+
+
+def _event_deferred_columns(info: Info, *path: str) -> list[str]:
+    """Return ContractEvent columns not needed by the selection at ``path``."""
+    selections = list(_flatten_selections(info.selected_fields))
+    for name in path:
+        selections = [
+            child
+            for selection in selections
+            if selection.name == name
+            for child in _flatten_selections(selection.selections)
+        ]
+    requested = {selection.name for selection in selections}
+    return ["raw_xdr"] + [
+        column
+        for field_name, column in _EVENT_OPTIONAL_COLUMNS.items()
+        if field_name not in requested
+    ]
+
+
+# Emulates a loose index scan over the (contract, event_type, timestamp)
+# index: each step seeks the next event_type above the previous one, so the
+# cost scales with the number of distinct types rather than events.
+_DISTINCT_EVENT_TYPES_SQL = """
+WITH RECURSIVE t AS (
+    (SELECT event_type FROM {table} WHERE contract_id = %(contract)s ORDER BY event_type LIMIT 1)
+    UNION ALL
+    SELECT (
+        SELECT event_type FROM {table}
+        WHERE contract_id = %(contract)s AND event_type > t.event_type
+        ORDER BY event_type LIMIT 1
+    )
+    FROM t WHERE t.event_type IS NOT NULL
+)
+SELECT event_type FROM t WHERE event_type IS NOT NULL
+"""
+
+
+def _distinct_event_types(contract_pk: int) -> list[str]:
+    """Return a contract's distinct event types, sorted."""
+    if connection.vendor != "postgresql":
+        return list(
+            ContractEvent.objects.filter(contract_id=contract_pk)
+            .order_by("event_type")
+            .values_list("event_type", flat=True)
+            .distinct()
+        )
+    table = connection.ops.quote_name(ContractEvent._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(_DISTINCT_EVENT_TYPES_SQL.format(table=table), {"contract": contract_pk})
+        return [row[0] for row in cursor.fetchall()]
+
+
 # ---------------------------------------------------------------------------
 # GraphQL types
 # ---------------------------------------------------------------------------
@@ -77,6 +149,10 @@ class ContractType:
 
     @strawberry.field
     def event_count(self) -> int:
+        # Prefer the count annotated by list resolvers to avoid a COUNT per row.
+        annotated = getattr(self, "_event_count", None)
+        if annotated is not None:
+            return annotated
         return self.events.count()
 
     @strawberry.field
@@ -128,7 +204,7 @@ class EventType:
     id: auto
     event_type: auto
     payload: strawberry.scalars.JSON
-    payload_hash: auto
+    payload_hash: str
     decoded_payload: Optional[strawberry.scalars.JSON]
     decoding_status: auto
     ledger: auto
@@ -397,7 +473,8 @@ class Query:
                 When(alias="", then=Value(1)),
                 default=Value(0),
                 output_field=IntegerField(),
-            )
+            ),
+            _event_count=Count("events", distinct=True),
         ).order_by("_has_alias", "alias", "-created_at")
         return qs
 
@@ -457,13 +534,16 @@ class Query:
         if tags is not None:
             for tag in tags:
                 qs = qs.filter(contractmetadata__tags__contains=[tag])
-        qs = qs.order_by("contractmetadata__name")
+        qs = qs.annotate(_event_count=Count("events", distinct=True)).order_by(
+            "contractmetadata__name"
+        )
         limit = min(limit, 100)
         return qs[:limit]
 
     @strawberry.field
     def events(
         self,
+        info: Info,
         contract_id: Optional[str] = None,
         event_type: Optional[str] = None,
         signature_status: Optional[str] = None,
@@ -487,7 +567,11 @@ class Query:
         if from_ledger is not None and to_ledger is not None and from_ledger > to_ledger:
             raise ValueError("from_ledger must be less than or equal to to_ledger")
         
-        qs = ContractEvent.objects.select_related("contract").order_by("id")
+        qs = (
+            ContractEvent.objects.select_related("contract")
+            .defer(*_event_deferred_columns(info, "events", "edges", "node"))
+            .order_by("id")
+        )
 
         if contract_id:
             qs = qs.filter(contract__contract_id=contract_id)
@@ -508,6 +592,8 @@ class Query:
 
         total_count = qs.count()
 
+        # Keyset pagination on id: each page is a range scan over the
+        # (contract, id) index instead of an OFFSET that discards rows.
         if after:
             try:
                 decoded = base64.b64decode(after).decode("utf-8")
@@ -544,18 +630,23 @@ class Query:
         )
 
     @strawberry.field
-    def event(self, id: int) -> Optional[EventType]:
+    def event(self, info: Info, id: int) -> Optional[EventType]:
         """Get a specific event by ID."""
         try:
-            return ContractEvent.objects.get(id=id)
+            return (
+                ContractEvent.objects.select_related("contract")
+                .defer(*_event_deferred_columns(info, "event"))
+                .get(id=id)
+            )
         except ContractEvent.DoesNotExist:
             return None
 
     @strawberry.field
-    def transaction(self, id: str) -> list[EventType]:
+    def transaction(self, info: Info, id: str) -> list[EventType]:
         """Return cross-contract events grouped by atomic transaction id."""
         return list(
             ContractEvent.objects.select_related("contract")
+            .defer(*_event_deferred_columns(info, "transaction"))
             .filter(tx_hash=id)
             .order_by("ledger", "event_index", "id")
         )
@@ -644,22 +735,24 @@ class Query:
         key = stable_cache_key("gql_contract_stats", {"contract_id": contract_id})
 
         def _stats():
-            try:
-                contract = TrackedContract.objects.get(contract_id=contract_id)
-            except TrackedContract.DoesNotExist:
-                return None
-
-            stats = contract.events.aggregate(
-                total=Count("id"),
-                unique_types=Count("event_type", distinct=True),
+            row = (
+                TrackedContract.objects.filter(contract_id=contract_id)
+                .annotate(
+                    total=Count("events"),
+                    unique_types=Count("events__event_type", distinct=True),
+                )
+                .values("contract_id", "name", "last_event_at", "total", "unique_types")
+                .first()
             )
+            if row is None:
+                return None
 
             return ContractStats(
-                contract_id=contract.contract_id,
-                name=contract.name,
-                total_events=stats["total"] or 0,
-                unique_event_types=stats["unique_types"] or 0,
-                last_activity=contract.last_event_at,
+                contract_id=row["contract_id"],
+                name=row["name"],
+                total_events=row["total"] or 0,
+                unique_event_types=row["unique_types"] or 0,
+                last_activity=row["last_event_at"],
             )
 
         return get_or_set_json(key, query_cache_ttl(), _stats)
@@ -681,15 +774,17 @@ class Query:
     @strawberry.field
     def event_types(self, contract_id: str) -> list[str]:
         """Get all unique event types for a contract."""
-        return list(
-            ContractEvent.objects.filter(contract__contract_id=contract_id)
-            .values_list("event_type", flat=True)
-            .distinct()
+        contract_pk = (
+            TrackedContract.objects.filter(contract_id=contract_id).values_list("pk", flat=True).first()
         )
+        if contract_pk is None:
+            return []
+        return _distinct_event_types(contract_pk)
 
     @strawberry.field
     def event_timeline(
         self,
+        info: Info,
         contract_id: str,
         bucket_size: TimelineBucketSize = TimelineBucketSize.THIRTY_MINUTES,
         event_types: Optional[list[str]] = None,
@@ -698,6 +793,7 @@ class Query:
         timezone: str = "UTC",
         limit_groups: int = 500,
         include_events: bool = True,
+        top_event_types: Optional[int] = None,
     ) -> EventTimelineResult:
         """Return grouped timeline data for contract event history."""
         bucket_seconds = BUCKET_SECONDS_BY_SIZE[bucket_size]
@@ -710,6 +806,8 @@ class Query:
             timezone_name=timezone,
             limit_groups=limit_groups,
             include_events=include_events,
+            defer_fields=_event_deferred_columns(info, "eventTimeline", "groups", "events"),
+            top_n=top_event_types,
         )
 
         groups = [
@@ -973,23 +1071,30 @@ class Mutation:
         except TrackedContract.DoesNotExist:
             return None
 
+        updated_fields = []
         if name is not None:
             contract.name = name
+            updated_fields.append("name")
         if description is not None:
             contract.description = description
+            updated_fields.append("description")
         if is_active is not None:
             contract.is_active = is_active
+            updated_fields.append("is_active")
         if alias is not None:
             contract.alias = alias
+            updated_fields.append("alias")
         if event_filter_type is not None:
             valid_types = {c[0] for c in TrackedContract.FILTER_TYPE_CHOICES}
             if event_filter_type not in valid_types:
                 raise Exception(f"Invalid event_filter_type. Must be one of: {valid_types}")
             contract.event_filter_type = event_filter_type
+            updated_fields.append("event_filter_type")
         if event_filter_list is not None:
             contract.event_filter_list = event_filter_list
+            updated_fields.append("event_filter_list")
 
-        contract.save()
+        contract.save(update_fields=[*updated_fields, "updated_at"])
 
         # Push notification when a contract is paused
         if is_active is False:
@@ -1095,7 +1200,8 @@ class Subscription:
         try:
             while True:
                 message = await channel_layer.receive(channel_name)
-                event_data = message.get("data", {})
+                # process_new_event broadcasts the event pre-encoded in "text".
+                event_data = message.get("data") or json.loads(message.get("text") or "{}")
                 
                 # Create EventType from the message data
                 try:
@@ -1121,4 +1227,10 @@ class Subscription:
             await channel_layer.group_discard(group_name, channel_name)
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    # Dashboards poll the same documents; skip re-parsing and re-validating them.
+    extensions=[ParserCache(maxsize=256), ValidationCache(maxsize=256)],
+)
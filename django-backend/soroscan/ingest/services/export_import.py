@@ -10,8 +10,10 @@ import logging
 from datetime import datetime, timezone
 from typing import IO, Iterator
 
+from django.core.exceptions import ValidationError
+
 from soroscan.ingest.cache_utils import invalidate_event_count_cache
-from soroscan.ingest.models import ContractEvent, TrackedContract
+from soroscan.ingest.models import ContractEvent, TrackedContract, validate_hex_digest
 
 logger = logging.getLogger(__name__)
 
@@ -257,13 +259,20 @@ def _row_to_event(row: dict, contracts: dict[str, TrackedContract]) -> ContractE
     def _parse_int(val):
         return int(val) if val not in (None, "") else None
 
+    # Checked per row: bulk_create would otherwise fail the whole batch.
+    payload_hash = row.get("payload_hash") or ""
+    try:
+        validate_hex_digest(payload_hash)
+    except ValidationError:
+        raise ValueError(f"Invalid payload_hash: {payload_hash!r}") from None
+
     return ContractEvent(
         contract=contract,
         event_type=row["event_type"],
         schema_version=_parse_int(row.get("schema_version")),
         validation_status=row.get("validation_status", "passed"),
         payload=_parse_json(row["payload"]),
-        payload_hash=row.get("payload_hash", ""),
+        payload_hash=payload_hash,
         ledger=int(row["ledger"]),
         event_index=int(row.get("event_index", 0)),
         timestamp=_parse_dt(row["timestamp"]),
@@ -2,24 +2,86 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Iterable, Sequence
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, Iterable, Iterator, NamedTuple, Sequence
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import (
+    Aggregate,
+    BigIntegerField,
+    Count,
+    Func,
+    Max,
+    Model,
+    Q,
+    Sum,
+)
 from django.utils import timezone
 
-from soroscan.ingest.models import ContractEvent
+from soroscan.ingest.cache_utils import (
+    HOURLY_AGGREGATE_WATERMARK_KEY,
+    get_or_set_json,
+    query_cache_ttl,
+    stable_cache_key,
+)
+from soroscan.ingest.models import ContractEvent, ContractEventHourly, TrackedContract
 
 
 MAX_GROUP_LIMIT = 1000
 DEFAULT_GROUP_LIMIT = 500
 DEFAULT_WINDOW_HOURS = 24
 
-
-@dataclass(frozen=True, slots=True)
-class TimelineTypeCount:
+# Columns needed to bucket events plus everything the GraphQL ``EventType``
+# exposes, so serializing ``include_events`` groups never lazy-loads per row.
+# The contract is loaded once per timeline and attached to each event.
+TIMELINE_EVENT_FIELDS = (
+    "id",
+    "event_type",
+    "payload",
+    "payload_hash",
+    "decoded_payload",
+    "decoding_status",
+    "ledger",
+    "event_index",
+    "timestamp",
+    "tx_hash",
+    "schema_version",
+    "validation_status",
+    "signature_status",
+)
+_LOCAL_EPOCH = datetime(1970, 1, 1)
+_event_type = attrgetter("event_type")
+_EVENT_CHUNK_SIZE = 2000
+# Zones loaded at app startup by warm_timezone_cache.
+COMMON_TIMEZONES = (
+    "UTC",
+    "America/New_York",
+    "America/Chicago",
+    "America/Los_Angeles",
+    "America/Sao_Paulo",
+    "Europe/London",
+    "Europe/Berlin",
+    "Africa/Lagos",
+    "Asia/Kolkata",
+    "Asia/Singapore",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+)
+# Beyond this many requested types, one filtered aggregate per type costs
+# more than grouping on event_type.
+_MAX_PIVOTED_EVENT_TYPES = 16
+
+
+class TimelineTypeCount(NamedTuple):
     """Count summary for one event type inside a timeline group."""
 
     event_type: str
@@ -34,7 +96,7 @@ class TimelineGroup:
     end: datetime
     event_count: int
     event_type_counts: list[TimelineTypeCount]
-    events: list[ContractEvent] = field(default_factory=list)
+    events: Sequence[ContractEvent] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,18 +116,73 @@ class _MutableGroup:
     end: datetime
     event_count: int = 0
     event_type_counts: dict[str, int] = field(default_factory=dict)
-    events: list[ContractEvent] = field(default_factory=list)
+    events: list[ContractEvent] | None = None
+
+
+class _LocalBucketEpoch(Func):
+    """
+    Bucket start for a timestamp, as epoch seconds of its local wall-clock time.
 
+    Mirrors :func:`floor_bucket_start`: the local time is floored to
+    ``bucket_seconds`` counted from local midnight. PostgreSQL only.
+    """
 
+    output_field = BigIntegerField()
+
+    def __init__(self, expression, *, timezone_name: str, bucket_seconds: int):
+        super().__init__(expression)
+        self.timezone_name = timezone_name
+        self.bucket_seconds = bucket_seconds
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        timestamp_sql, timestamp_params = compiler.compile(self.source_expressions[0])
+        if 86_400 % self.bucket_seconds == 0:
+            # Buckets that tile the day line up with local midnight when
+            # binned from the epoch, so date_bin can do the flooring natively.
+            sql = (
+                f"EXTRACT(EPOCH FROM date_bin(%s * INTERVAL '1 second',"
+                f" {timestamp_sql} AT TIME ZONE %s, TIMESTAMP '1970-01-01'))::bigint"
+            )
+            return sql, (self.bucket_seconds, *timestamp_params, self.timezone_name)
+        local_epoch = f"EXTRACT(EPOCH FROM ({timestamp_sql} AT TIME ZONE %s))::numeric"
+        sql = (
+            f"(FLOOR({local_epoch} / 86400) * 86400"
+            f" + FLOOR(MOD({local_epoch}, 86400) / %s) * %s)::bigint"
+        )
+        params = (
+            *timestamp_params,
+            self.timezone_name,
+            *timestamp_params,
+            self.timezone_name,
+            self.bucket_seconds,
+            self.bucket_seconds,
+        )
+        return sql, params
+
+
+@lru_cache(maxsize=512)
 def resolve_tz(timezone_name: str) -> ZoneInfo:
     """Resolve an IANA timezone name into a ZoneInfo object."""
 
     try:
         return ZoneInfo(timezone_name)
-    except ZoneInfoNotFoundError as err:
+    # Malformed keys (empty, absolute or relative paths) raise ValueError and
+    # overlong ones OSError from the filesystem lookup.
+    except (ZoneInfoNotFoundError, ValueError, OSError) as err:
         raise ValueError(f"Unsupported timezone: {timezone_name}") from err
 
 
+def warm_timezone_cache(timezone_names: Iterable[str] = COMMON_TIMEZONES) -> None:
+    """Load commonly requested zones so first requests skip the tzdata read."""
+
+    for timezone_name in timezone_names:
+        try:
+            resolve_tz(timezone_name)
+        except ValueError:
+            # A slimmed-down tz database shouldn't stop the app from starting.
+            continue
+
+
 def normalize_time_window(
     since: datetime | None,
     until: datetime | None,
@@ -84,9 +201,7 @@ def normalize_time_window(
 def clamp_group_limit(limit_groups: int) -> int:
     """Clamp timeline group limit to a safe bounded range."""
 
-    if limit_groups <= 0:
-        return 1
-    return min(limit_groups, MAX_GROUP_LIMIT)
+    return max(1, min(limit_groups, MAX_GROUP_LIMIT))
 
 
 def build_timeline(
@@ -99,93 +214,439 @@ def build_timeline(
     timezone_name: str,
     limit_groups: int = DEFAULT_GROUP_LIMIT,
     include_events: bool = False,
+    defer_fields: Sequence[str] = (),
+    top_n: int | None = None,
 ) -> TimelineResult:
-    """Build grouped timeline data for a contract."""
+    """
+    Build grouped timeline data for a contract.
+
+    On PostgreSQL, buckets are counted with a GROUP BY and events are only
+    loaded for the groups returned; other backends bucket in Python. The
+    timeline covers a single contract, so it is loaded once and shared by all
+    returned events instead of being joined per row. Callers that know
+    some event columns won't be read (e.g. unselected GraphQL fields) can
+    pass them as ``defer_fields``. ``top_n`` keeps only the most frequent
+    event types in each group's ``event_type_counts``.
+
+    Count-only results are cached for ``QUERY_CACHE_TTL_SECONDS``, keyed on
+    the normalized bounds and the contract's latest event id, once the
+    window ended more than ``AGGREGATE_WATERMARK_GRACE_SECONDS`` ago. Any
+    ingest path, including a backfill into an old window, raises the latest
+    id and so misses the cache. Later windows (no ``until``, or one inside
+    the grace period) can still receive late-committed events and are always
+    computed.
+    """
 
     if bucket_seconds <= 0:
         raise ValueError("bucket_seconds must be greater than 0")
+    if top_n is not None and top_n <= 0:
+        raise ValueError("top_n must be greater than 0")
 
     selected_timezone = resolve_tz(timezone_name)
     normalized_since, normalized_until = normalize_time_window(since=since, until=until)
     bounded_group_limit = clamp_group_limit(limit_groups)
 
-    queryset = (
-        ContractEvent.objects.filter(
-            contract__contract_id=contract_id,
-            timestamp__gte=normalized_since,
-            timestamp__lte=normalized_until,
+    def _compute() -> TimelineResult:
+        return _compute_timeline(
+            contract_id=contract_id,
+            bucket_seconds=bucket_seconds,
+            event_types=event_types,
+            normalized_since=normalized_since,
+            normalized_until=normalized_until,
+            selected_timezone=selected_timezone,
+            bounded_group_limit=bounded_group_limit,
+            include_events=include_events,
+            defer_fields=defer_fields,
+            top_n=top_n,
         )
-        .select_related("contract")
-        .order_by("-timestamp", "-event_index")
+
+    grace = int(getattr(settings, "AGGREGATE_WATERMARK_GRACE_SECONDS", 600))
+    settled_before = timezone.now() - timedelta(seconds=grace)
+    if include_events or until is None or normalized_until > settled_before:
+        return _compute()
+
+    cache_key = stable_cache_key(
+        "timeline",
+        {
+            "contract_id": contract_id,
+            "bucket_seconds": bucket_seconds,
+            "event_types": sorted(event_types) if event_types else None,
+            "since": normalized_since.astimezone(UTC).isoformat(),
+            "until": normalized_until.astimezone(UTC).isoformat(),
+            "timezone": selected_timezone.key,
+            "limit_groups": bounded_group_limit,
+            "top_n": top_n,
+            # Served from the (contract, id) index.
+            "latest_event_id": ContractEvent.objects.filter(contract__contract_id=contract_id).aggregate(
+                latest=Max("id")
+            )["latest"],
+        },
     )
+    return get_or_set_json(cache_key, query_cache_ttl(), _compute)
+
+
+def _compute_timeline(
+    *,
+    contract_id: str,
+    bucket_seconds: int,
+    event_types: Sequence[str] | None,
+    normalized_since: datetime,
+    normalized_until: datetime,
+    selected_timezone: ZoneInfo,
+    bounded_group_limit: int,
+    include_events: bool,
+    defer_fields: Sequence[str],
+    top_n: int | None,
+) -> TimelineResult:
+    def bucket_start_for(timestamp: datetime) -> datetime:
+        return floor_bucket_start(
+            timestamp=timestamp,
+            bucket_seconds=bucket_seconds,
+            selected_timezone=selected_timezone,
+        )
+
+    contract: TrackedContract | None = None
+    if include_events:
+        # Every event belongs to this one contract: load it once and attach
+        # it to each event rather than joining it onto every row.
+        contract = TrackedContract.objects.only("id", "contract_id", "name").filter(contract_id=contract_id).first()
+        if contract is None:
+            return TimelineResult(
+                contract_id=contract_id,
+                since=normalized_since,
+                until=normalized_until,
+                total_events=0,
+                groups=[],
+            )
+        queryset = ContractEvent.objects.filter(contract=contract)
+    else:
+        queryset = ContractEvent.objects.filter(contract__contract_id=contract_id)
+    queryset = queryset.filter(timestamp__gte=normalized_since, timestamp__lte=normalized_until)
 
     if event_types:
         queryset = queryset.filter(event_type__in=event_types)
 
-    events = list(queryset)
-    grouped = _group_events(
-        events=events,
-        bucket_seconds=bucket_seconds,
-        selected_timezone=selected_timezone,
-        include_events=include_events,
-    )
+    if connections[queryset.db].vendor == "postgresql":
+        # Bucket and count in the database so only one row per
+        # (bucket, event_type) is shipped, then load events for the kept
+        # groups only.
+        local_bucket = _LocalBucketEpoch(
+            "timestamp",
+            timezone_name=selected_timezone.key,
+            bucket_seconds=bucket_seconds,
+        )
+        rows: list[tuple[int, str, int]] = []
+        aggregate = _aggregate_source(
+            since=normalized_since,
+            until=normalized_until,
+            bucket_seconds=bucket_seconds,
+            selected_timezone=selected_timezone,
+        )
+        if aggregate is not None:
+            # Complete slots come pre-counted from a rollup; the partial slots
+            # at either edge, and events added since the rollup's last
+            # refresh, are counted from raw events.
+            rollup_model, rollup_start, rollup_end, through_id = aggregate
+            rollup = rollup_model.objects.filter(
+                contract__contract_id=contract_id,
+                bucket__gte=rollup_start,
+                bucket__lt=rollup_end,
+            )
+            if event_types:
+                rollup = rollup.filter(event_type__in=event_types)
+            rows.extend(
+                _bucket_type_counts(
+                    rollup.annotate(
+                        local_bucket=_LocalBucketEpoch(
+                            "bucket",
+                            timezone_name=selected_timezone.key,
+                            bucket_seconds=bucket_seconds,
+                        )
+                    ),
+                    ("local_bucket",),
+                    event_types=event_types,
+                    aggregate=Sum,
+                    field="event_count",
+                )
+            )
+            raw = queryset.exclude(timestamp__gte=rollup_start, timestamp__lt=rollup_end, id__lte=through_id)
+        else:
+            raw = queryset
+        rows.extend(
+            _bucket_type_counts(
+                raw.annotate(local_bucket=local_bucket),
+                ("local_bucket",),
+                event_types=event_types,
+            )
+        )
+        grouped = _group_bucket_counts(
+            rows=rows,
+            bucket_seconds=bucket_seconds,
+            selected_timezone=selected_timezone,
+        )
+        total_events = sum(group.event_count for group in grouped)
+        grouped = grouped[:bounded_group_limit]
+        if include_events and grouped:
+            _attach_events(
+                groups=grouped,
+                events=_timeline_events(
+                    queryset.filter(timestamp__gte=grouped[-1].start),
+                    defer_fields=defer_fields,
+                    contract=contract,
+                ),
+                bucket_start_for=bucket_start_for,
+            )
+    elif not include_events:
+        # Other backends bucket in Python with the same floor used for
+        # events, counting (bucket, event_type) pairs off plain tuples.
+        rows = queryset.order_by().values_list("timestamp", "event_type").iterator(chunk_size=_EVENT_CHUNK_SIZE)
+        pair_counts = Counter((bucket_start_for(timestamp), event_type) for timestamp, event_type in rows)
+        grouped = _group_pair_counts(pair_counts=pair_counts, bucket_seconds=bucket_seconds)
+        total_events = sum(group.event_count for group in grouped)
+        grouped = grouped[:bounded_group_limit]
+    else:
+        # Stream rows rather than caching the whole result set.
+        grouped = _group_events(
+            events=_timeline_events(queryset, defer_fields=defer_fields, contract=contract),
+            bucket_seconds=bucket_seconds,
+            bucket_start_for=bucket_start_for,
+            limit=bounded_group_limit,
+        )
+        if len(grouped) < bounded_group_limit:
+            total_events = sum(group.event_count for group in grouped)
+        else:
+            # Grouping stopped at the limit; older events were never read.
+            total_events = queryset.count()
 
     groups = [
         TimelineGroup(
             start=item.start,
             end=item.end,
             event_count=item.event_count,
-            event_type_counts=_sorted_type_counts(item.event_type_counts),
-            events=item.events if include_events else [],
+            event_type_counts=_sorted_type_counts(item.event_type_counts, top_n),
+            events=item.events if include_events else (),
         )
-        for item in grouped[:bounded_group_limit]
+        for item in grouped
     ]
 
     return TimelineResult(
         contract_id=contract_id,
         since=normalized_since,
         until=normalized_until,
-        total_events=len(events),
+        total_events=total_events,
         groups=groups,
     )
 
 
-def _group_events(
+def _bucket_type_counts(
+    queryset,
+    bucket_fields: Sequence[str],
     *,
-    events: Iterable[ContractEvent],
+    event_types: Sequence[str] | None,
+    aggregate: type[Aggregate] = Count,
+    field: str = "id",
+) -> Iterator[tuple]:
+    """
+    Yield ``(*bucket_fields, event_type, count)`` rows for ``queryset``.
+
+    For a short explicit ``event_types`` list, each type is counted with a
+    filtered aggregate so the database returns one row per bucket rather
+    than one per (bucket, event_type); otherwise rows are grouped on both.
+    """
+
+    queryset = queryset.order_by()
+    pivot = list(dict.fromkeys(event_types or ()))
+    if not pivot or len(pivot) > _MAX_PIVOTED_EVENT_TYPES:
+        yield from queryset.values_list(*bucket_fields, "event_type").annotate(count=aggregate(field))
+        return
+
+    width = len(bucket_fields)
+    per_type = {
+        f"event_type_{index}": aggregate(field, filter=Q(event_type=event_type))
+        for index, event_type in enumerate(pivot)
+    }
+    for row in queryset.values_list(*bucket_fields).annotate(**per_type):
+        bucket = row[:width]
+        for event_type, count in zip(pivot, row[width:]):
+            if count:
+                yield (*bucket, event_type, count)
+
+
+def _aggregate_source(
+    *,
+    since: datetime,
+    until: datetime,
+    bucket_seconds: int,
+    selected_timezone: ZoneInfo,
+) -> tuple[type[Model], datetime, datetime, int] | None:
+    """
+    Return ``(rollup model, start, end, through_id)`` for the ``[start, end)``
+    span of whole UTC hours servable from the hourly rollup, or ``None`` if
+    there is none.
+
+    The rollup counts events with ids up to ``through_id``; later ones, such
+    as backfills since its last refresh, are still read from raw events. UTC
+    hours only map onto local buckets when buckets are whole hours and the
+    timezone's offset is a whole number of hours.
+    """
+
+    coverage = cache.get(HOURLY_AGGREGATE_WATERMARK_KEY)
+    if coverage is None or bucket_seconds % 3_600:
+        return None
+    watermark, through_id = coverage
+    if any(bound.astimezone(selected_timezone).utcoffset().total_seconds() % 3_600 for bound in (since, until)):
+        return None
+
+    start_epoch = -(-int(since.timestamp()) // 3_600) * 3_600
+    end_epoch = int(until.timestamp()) // 3_600 * 3_600
+    start = datetime.fromtimestamp(start_epoch, UTC)
+    end = min(datetime.fromtimestamp(end_epoch, UTC), watermark)
+    if start >= end:
+        return None
+    return ContractEventHourly, start, end, through_id
+
+
+def _timeline_events(
+    queryset,
+    *,
+    defer_fields: Sequence[str],
+    contract: TrackedContract,
+) -> Iterator[ContractEvent]:
+    """Stream events newest first, each pointing at the shared ``contract``."""
+
+    events = (
+        queryset.only(*TIMELINE_EVENT_FIELDS)
+        .defer(*defer_fields)
+        .order_by("-timestamp", "-event_index")
+        .iterator(chunk_size=_EVENT_CHUNK_SIZE)
+    )
+    for event in events:
+        event.contract = contract
+        yield event
+
+
+def _group_bucket_counts(
+    *,
+    rows: Iterable[tuple[int, str, int]],
     bucket_seconds: int,
     selected_timezone: ZoneInfo,
-    include_events: bool,
 ) -> list[_MutableGroup]:
-    grouped: dict[datetime, _MutableGroup] = {}
+    """Build groups, newest first, from ``(local bucket epoch, event_type, count)`` rows."""
 
-    for event in events:
-        bucket_start = floor_bucket_start(
-            timestamp=event.timestamp,
-            bucket_seconds=bucket_seconds,
-            selected_timezone=selected_timezone,
-        )
-        current_group = grouped.get(bucket_start)
+    grouped: dict[int, _MutableGroup] = {}
+    bucket_span = timedelta(seconds=bucket_seconds)
+
+    for bucket_epoch, event_type, count in rows:
+        current_group = grouped.get(bucket_epoch)
         if current_group is None:
+            bucket_start = (_LOCAL_EPOCH + timedelta(seconds=bucket_epoch)).replace(tzinfo=selected_timezone)
             current_group = _MutableGroup(
                 start=bucket_start,
-                end=bucket_start + timedelta(seconds=bucket_seconds),
-                event_type_counts=defaultdict(int),
+                end=bucket_start + bucket_span,
             )
-            grouped[bucket_start] = current_group
+            grouped[bucket_epoch] = current_group
 
-        current_group.event_count += 1
-        current_group.event_type_counts[event.event_type] += 1
+        current_group.event_count += count
+        type_counts = current_group.event_type_counts
+        type_counts[event_type] = type_counts.get(event_type, 0) + count
 
-        if include_events:
-            current_group.events.append(event)
+    return [grouped[key] for key in sorted(grouped, reverse=True)]
 
-    groups = sorted(grouped.values(), key=lambda item: item.start, reverse=True)
 
-    if include_events:
-        for group in groups:
-            group.events.sort(key=lambda event: (event.timestamp, event.event_index), reverse=True)
+def _group_pair_counts(
+    *,
+    pair_counts: Counter[tuple[datetime, str]],
+    bucket_seconds: int,
+) -> list[_MutableGroup]:
+    """
+    Build groups, newest first, from ``(bucket start, event_type) -> count``.
 
+    The flat counter is sorted by bucket once, so each bucket's type counts
+    are materialized in a single ``dict`` call instead of per-pair lookups.
+    """
+
+    groups: list[_MutableGroup] = []
+    bucket_span = timedelta(seconds=bucket_seconds)
+    ordered = sorted(pair_counts.items(), key=_pair_bucket_start, reverse=True)
+
+    for bucket_start, run in groupby(ordered, key=_pair_bucket_start):
+        type_counts = {event_type: count for (_, event_type), count in run}
+        groups.append(
+            _MutableGroup(
+                start=bucket_start,
+                end=bucket_start + bucket_span,
+                event_count=sum(type_counts.values()),
+                event_type_counts=type_counts,
+            )
+        )
+
+    return groups
+
+
+def _pair_bucket_start(item: tuple[tuple[datetime, str], int]) -> datetime:
+    return item[0][0]
+
+
+def _attach_events(
+    *,
+    groups: list[_MutableGroup],
+    events: Iterable[ContractEvent],
+    bucket_start_for: Callable[[datetime], datetime],
+) -> None:
+    by_start = {group.start: group for group in groups}
+    for group in groups:
+        group.events = []
+
+    for event in events:
+        group = by_start.get(bucket_start_for(event.timestamp))
+        if group is not None:
+            group.events.append(event)
+
+
+def _group_events(
+    *,
+    events: Iterable[ContractEvent],
+    bucket_seconds: int,
+    bucket_start_for: Callable[[datetime], datetime],
+    limit: int | None = None,
+) -> list[_MutableGroup]:
+    """
+    Group events, which must be ordered newest first, into buckets.
+
+    Like a sorted group-by, ordered input means every bucket is one
+    contiguous run and runs already come out newest first, so no final sort
+    is needed; each run's types are counted in one C-level pass. The only
+    exception is a wall-clock slot repeated when clocks go back, whose
+    second run is folded into the group started by the first.
+    Stops reading ``events`` once ``limit`` groups are complete.
+    """
+
+    groups: list[_MutableGroup] = []
+    by_start: dict[datetime, _MutableGroup] = {}
+    bucket_span = timedelta(seconds=bucket_seconds)
+
+    for bucket_start, run in groupby(events, key=lambda event: bucket_start_for(event.timestamp)):
+        run_events = list(run)
+        current_group = by_start.get(bucket_start)
+        if current_group is not None:
+            # Clocks went back and the same wall-clock slot came round again.
+            current_group.events.extend(run_events)
+            current_group.event_count += len(run_events)
+            current_group.event_type_counts.update(map(_event_type, run_events))
+            continue
+        current_group = _MutableGroup(
+            start=bucket_start,
+            end=bucket_start + bucket_span,
+            event_count=len(run_events),
+            event_type_counts=Counter(map(_event_type, run_events)),
+            events=run_events,
+        )
+        groups.append(current_group)
+        by_start[bucket_start] = current_group
+        if len(groups) == limit:
+            break
+
+    # Runs keep input order, which is already (-timestamp, -event_index).
     return groups
 
 
@@ -195,12 +656,17 @@ def floor_bucket_start(
     bucket_seconds: int,
     selected_timezone: ZoneInfo,
 ) -> datetime:
-    """Floor a timestamp to the configured bucket in the selected timezone."""
+    """
+    Floor a timestamp to the configured bucket in the selected timezone.
+
+    Buckets are local wall-clock slots, so a slot repeated when clocks go
+    back is one bucket, reported at its first occurrence.
+    """
 
     if timezone.is_naive(timestamp):
         timestamp = timezone.make_aware(timestamp, UTC)
 
-    localized = timestamp.astimezone(selected_timezone)
+    localized = timestamp.astimezone(selected_timezone).replace(fold=0)
 
     if bucket_seconds == 86_400:
         return localized.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -231,6 +697,13 @@ def _ensure_aware(value: datetime) -> datetime:
     return value
 
 
-def _sorted_type_counts(counts: dict[str, int]) -> list[TimelineTypeCount]:
-    ordered_items = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
-    return [TimelineTypeCount(event_type=event_type, count=count) for event_type, count in ordered_items]
+def _type_count_order(item: tuple[str, int]) -> tuple[int, str]:
+    return (-item[1], item[0])
+
+
+def _sorted_type_counts(counts: dict[str, int], top_n: int | None = None) -> list[TimelineTypeCount]:
+    if top_n is not None and top_n < len(counts):
+        ordered_items = heapq.nsmallest(top_n, counts.items(), key=_type_count_order)
+    else:
+        ordered_items = sorted(counts.items(), key=_type_count_order)
+    return list(map(TimelineTypeCount._make, ordered_items))
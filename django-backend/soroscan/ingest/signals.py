@@ -0,0 +1,14 @@
+"""
+Model signal handlers for cache invalidation.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache_utils import invalidate_contract_active_cache
+from .models import TrackedContract
+
+
+@receiver(post_save, sender=TrackedContract)
+@receiver(post_delete, sender=TrackedContract)
+def _invalidate_contract_caches(sender, instance, **kwargs):
+    invalidate_contract_active_cache(instance.contract_id)
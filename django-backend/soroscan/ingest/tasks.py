@@ -11,6 +11,8 @@ import logging
 import pstats
 import re
 import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Any
 
@@ -22,10 +24,14 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 from celery.signals import task_postrun, task_prerun
 from django.conf import settings
-from django.db.models import Count, F, Max, Min
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Model, Q
 from django.utils import timezone
 
 from .cache_utils import (
+    HOURLY_AGGREGATE_WATERMARK_KEY,
+    HOURLY_AGGREGATE_WATERMARK_TTL,
     invalidate_event_count_cache,
     get_cached_decoded_payload,
     set_cached_decoded_payload,
@@ -35,6 +41,7 @@ from .cache_utils import (
 from .models import (
     ContractABI,
     ContractEvent,
+    ContractEventHourly,
     ContractSigningKey,
     TrackedContract,
     WebhookSubscription,
@@ -51,6 +58,7 @@ from .rate_limit import check_ingest_rate
 from .stellar_client import SorobanClient
 from .metrics import webhook_payload_bytes
 from .streaming import get_producer
+from .validators import get_validator
 
 logger = logging.getLogger(__name__)
 BATCH_LEDGER_SIZE = 200
@@ -309,7 +317,7 @@ def validate_contract_payload_schema(
         return True
 
     try:
-        jsonschema.validate(instance=payload, schema=contract.json_schema)
+        get_validator(contract.json_schema).validate(payload)
         return True
     except jsonschema.ValidationError as exc:
         logger.error(
@@ -597,7 +605,7 @@ def validate_event_payload(
     if schema is None:
         return (True, None)
     try:
-        jsonschema.validate(instance=payload, schema=schema.json_schema)
+        get_validator(schema.json_schema).validate(payload)
         return (True, schema.version)
     except jsonschema.ValidationError:
         logger.warning(
@@ -973,16 +981,21 @@ def process_new_event(event_data: dict[str, Any]) -> None:
         logger.warning("Event missing contract_id", extra={})
         return
 
+    from .consumers import encode_event, event_group_name
+
     channel_layer = get_channel_layer()
     if channel_layer:
         try:
-            async_to_sync(channel_layer.group_send)(
-                f"events_{contract_id}",
-                {
-                    "type": "contract_event",
-                    "data": event_data,
-                },
-            )
+            # Serialize once here rather than once per connected WebSocket,
+            # and ship only the encoded text so each group send carries one copy.
+            message = {"type": "contract_event", "text": encode_event(event_data)}
+            # Unfiltered subscribers listen on the contract group; filtered
+            # ones listen on the per-event-type group.
+            async_to_sync(channel_layer.group_send)(event_group_name(contract_id), message)
+            if event_type:
+                async_to_sync(channel_layer.group_send)(
+                    event_group_name(contract_id, event_type), message
+                )
         except Exception as e:
             logger.error(
                 "Failed to publish event to channel layer: %s",
@@ -1478,6 +1491,153 @@ def aggregate_event_statistics() -> dict[str, Any]:
     }
 
 
+def _aggregate_watermark(slot_seconds: int) -> datetime:
+    """
+    Return the slot boundary below which timelines read a rollup refreshed now.
+
+    Events land some time after their ledger timestamp, so the watermark lags
+    ``now`` by ``AGGREGATE_WATERMARK_GRACE_SECONDS`` before flooring. Slots in
+    that window stay on the raw-event side of the timeline split, where a
+    late commit is counted at once instead of waiting for the next refresh
+    to rescan it.
+    """
+    grace = int(getattr(settings, "AGGREGATE_WATERMARK_GRACE_SECONDS", 600))
+    epoch = int((timezone.now() - timedelta(seconds=grace)).timestamp())
+    return datetime.fromtimestamp(epoch - epoch % slot_seconds, tz=dt_timezone.utc)
+
+
+_ROLLUP_BATCH_SLOTS = 500
+
+
+def _rollup_state_key(rollup_model: type[Model]) -> str:
+    return f"rollup:{rollup_model._meta.db_table}"
+
+
+def _slot_start(timestamp: datetime, slot_seconds: int) -> datetime:
+    epoch = int(timestamp.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % slot_seconds, tz=dt_timezone.utc)
+
+
+def _recount_rollup_slots(
+    rollup_model: type[Model],
+    slot_seconds: int,
+    slots: Iterable[tuple[int, datetime]],
+    through_id: int,
+) -> None:
+    """
+    Recount ``(contract pk, slot start)`` pairs of a rollup from raw events.
+
+    Each slot's rows are replaced by counts of its events with
+    ``id <= through_id``; event types no longer present are dropped.
+    """
+    slot_span = timedelta(seconds=slot_seconds)
+    starts_by_contract: dict[int, set[datetime]] = defaultdict(set)
+    for contract_pk, slot in slots:
+        starts_by_contract[contract_pk].add(slot)
+
+    for contract_pk, starts in starts_by_contract.items():
+        ordered = sorted(starts)
+        for offset in range(0, len(ordered), _ROLLUP_BATCH_SLOTS):
+            batch = ordered[offset : offset + _ROLLUP_BATCH_SLOTS]
+            # Adjacent slots are read as one range.
+            in_slots = Q()
+            range_start = range_end = batch[0]
+            for start in batch[1:] + [None]:
+                if start == range_end + slot_span:
+                    range_end = start
+                    continue
+                in_slots |= Q(timestamp__gte=range_start, timestamp__lt=range_end + slot_span)
+                range_start = range_end = start
+
+            rows = (
+                ContractEvent.objects.filter(in_slots, contract_id=contract_pk, id__lte=through_id)
+                .order_by()
+                .values_list("timestamp", "event_type")
+                .iterator(chunk_size=5000)
+            )
+            counts = Counter((_slot_start(timestamp, slot_seconds), event_type) for timestamp, event_type in rows)
+            with transaction.atomic():
+                rollup_model.objects.filter(contract_id=contract_pk, bucket__in=batch).delete()
+                rollup_model.objects.bulk_create(
+                    [
+                        rollup_model(contract_id=contract_pk, bucket=bucket, event_type=event_type, event_count=count)
+                        for (bucket, event_type), count in counts.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["contract", "bucket", "event_type"],
+                    update_fields=["event_count"],
+                )
+
+
+def _refresh_event_rollup(rollup_model: type[Model], slot_seconds: int) -> tuple[int, int]:
+    """
+    Bring an event-count rollup up to date; return ``(through_id, slots recounted)``.
+
+    Only slots holding events added since the previous run are recounted, so
+    a run costs O(new events) however old their timestamps are; backfills
+    land in the rollup like live events. Ids are allocated before commit, so
+    each run rescans from the cursor of the run before last: an event that
+    commits after a higher id was already counted is picked up one run later.
+    """
+    state_key = _rollup_state_key(rollup_model)
+    state = IndexerState.objects.filter(key=state_key).values_list("value", flat=True).first()
+    rescan_from, previous_through_id = json.loads(state) if state else (0, 0)
+    through_id = ContractEvent.objects.aggregate(last=Max("id"))["last"] or 0
+
+    touched = {
+        (contract_pk, _slot_start(timestamp, slot_seconds))
+        for contract_pk, timestamp in ContractEvent.objects.filter(id__gt=rescan_from, id__lte=through_id)
+        .order_by()
+        .values_list("contract_id", "timestamp")
+        .iterator(chunk_size=5000)
+    }
+    _recount_rollup_slots(rollup_model, slot_seconds, touched, through_id)
+    IndexerState.objects.update_or_create(
+        key=state_key,
+        defaults={"value": json.dumps([previous_through_id, through_id])},
+    )
+    return through_id, len(touched)
+
+
+def _recount_hourly_rollup(events: Iterable[tuple[int, datetime]]) -> None:
+    """Recount the hourly rollup slots holding ``(contract pk, timestamp)`` events, e.g. after deleting them."""
+    state = IndexerState.objects.filter(key=_rollup_state_key(ContractEventHourly)).values_list("value", flat=True).first()
+    if state is None:
+        # Never built; the first refresh counts everything.
+        return
+    _recount_rollup_slots(
+        ContractEventHourly,
+        3_600,
+        {(contract_pk, _slot_start(timestamp, 3_600)) for contract_pk, timestamp in events},
+        json.loads(state)[1],
+    )
+
+
+@shared_task(name="ingest.tasks.refresh_contract_event_hourly")
+def refresh_contract_event_hourly() -> dict[str, Any]:
+    """
+    Bring the hourly event-count rollup up to date.
+
+    Publishes the watermark below which timelines read the rollup, and the
+    event id it counts through, to the cache; events past that id are read
+    from the raw table.
+    """
+    _start = time.monotonic()
+    watermark = _aggregate_watermark(3_600)
+    through_id, recounted = _refresh_event_rollup(ContractEventHourly, 3_600)
+
+    cache.set(HOURLY_AGGREGATE_WATERMARK_KEY, (watermark, through_id), timeout=HOURLY_AGGREGATE_WATERMARK_TTL)
+    _get_metrics().task_duration_seconds.labels(
+        task_name="refresh_contract_event_hourly"
+    ).observe(time.monotonic() - _start)
+    return {
+        "refreshed": True,
+        "watermark": watermark.isoformat(),
+        "through_id": through_id,
+        "recounted_slots": recounted,
+    }
+
+
 @shared_task(name="ingest.tasks.reconcile_event_completeness")
 def reconcile_event_completeness() -> dict[str, Any]:
     """
@@ -2362,7 +2522,11 @@ def archive_old_events() -> dict:
                 archived_ids = list(
                     base_qs.order_by("timestamp").values_list("id", flat=True)[:10000]
                 )
+                archived_events = list(
+                    ContractEvent.objects.filter(id__in=archived_ids).values_list("contract_id", "timestamp")
+                )
                 deleted_count, _ = ContractEvent.objects.filter(id__in=archived_ids).delete()
+                _recount_hourly_rollup(archived_events)
                 total_archived += batch.event_count
                 total_deleted += deleted_count
                 batch_index += 1
@@ -68,6 +68,16 @@ class ContractEventFactory(DjangoModelFactory):
     timestamp = factory.Faker("date_time")
     tx_hash = factory.Sequence(lambda n: f"{'b' * 64}")
 
+    @classmethod
+    def create_batch_bulk(cls, specs):
+        """
+        Insert one event per spec dict with a single ``bulk_create``.
+
+        Skips ``save()`` and signals; each spec must include a saved
+        ``contract``, since building would leave the SubFactory unsaved.
+        """
+        return ContractEvent.objects.bulk_create([cls.build(**spec) for spec in specs])
+
 
 class WebhookSubscriptionFactory(DjangoModelFactory):
     class Meta:
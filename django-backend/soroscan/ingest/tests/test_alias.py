@@ -6,6 +6,9 @@ and list sorting by alias.
 import pytest
 from unittest.mock import Mock
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from soroscan.ingest.models import TrackedContract
 from soroscan.ingest.schema import schema
 from soroscan.ingest.serializers import TrackedContractSerializer
@@ -169,6 +172,27 @@ class TestAliasGraphQL:
         contract.refresh_from_db()
         assert contract.alias == "My Friendly Name"
 
+    def test_update_contract_mutation_writes_only_changed_columns(self):
+        user = UserFactory()
+        contract = TrackedContractFactory(owner=user, alias="")
+        mutation = f"""
+            mutation {{
+                updateContract(contractId: "{contract.contract_id}", alias: "Short") {{
+                    alias
+                }}
+            }}
+        """
+        context = create_context_with_user(user)
+        with CaptureQueriesContext(connection) as ctx:
+            result = schema.execute_sync(mutation, context_value=context)
+        assert result.errors is None
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        set_clause = updates[0].split(" SET ")[1].split(" WHERE ")[0]
+        assert '"alias"' in set_clause
+        assert '"name"' not in set_clause
+
     def test_update_contract_mutation_clears_alias(self):
         user = UserFactory()
         contract = TrackedContractFactory(owner=user, alias="Old Alias")
@@ -0,0 +1,145 @@
+"""
+Tests for the raw WebSocket EventConsumer.
+"""
+import json
+import re
+
+import orjson
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+
+from soroscan.ingest.cache_utils import contract_active_cache_key
+from soroscan.ingest.consumers import EventConsumer, encode_event, event_group_name
+
+
+@pytest.mark.django_db
+class TestContractIsActive:
+    def setup_method(self):
+        cache.clear()
+
+    def test_lookup_is_cached(self, contract, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert async_to_sync(EventConsumer.contract_is_active)(contract.contract_id) is True
+        with django_assert_num_queries(0):
+            assert async_to_sync(EventConsumer.contract_is_active)(contract.contract_id) is True
+
+    def test_save_invalidates_cached_flag(self, contract):
+        assert async_to_sync(EventConsumer.contract_is_active)(contract.contract_id) is True
+
+        contract.is_active = False
+        contract.save()
+
+        assert cache.get(contract_active_cache_key(contract.contract_id)) is None
+        assert async_to_sync(EventConsumer.contract_is_active)(contract.contract_id) is False
+
+    def test_unknown_contract_is_inactive(self):
+        assert async_to_sync(EventConsumer.contract_is_active)("C" + "Z" * 55) is False
+
+
+class TestEventTypeQueryParam:
+    CONTRACT_ID = "C" + "Q" * 55
+
+    def setup_method(self):
+        cache.set(contract_active_cache_key(self.CONTRACT_ID), True)
+
+    def _received_types(self, query_string, sent_types):
+        from channels.layers import get_channel_layer
+        from channels.routing import URLRouter
+        from channels.testing import WebsocketCommunicator
+
+        from soroscan.ingest.routing import websocket_urlpatterns
+
+        async def run():
+            communicator = WebsocketCommunicator(
+                URLRouter(websocket_urlpatterns),
+                f"/ws/events/{self.CONTRACT_ID}/?{query_string}",
+            )
+            connected, _ = await communicator.connect()
+            assert connected
+            layer = get_channel_layer()
+            for event_type in sent_types:
+                message = {"type": "contract_event", "data": {"event_type": event_type}}
+                await layer.group_send(event_group_name(self.CONTRACT_ID), message)
+                await layer.group_send(event_group_name(self.CONTRACT_ID, event_type), message)
+            received = []
+            while not await communicator.receive_nothing(timeout=0.1):
+                received.append((await communicator.receive_json_from())["event_type"])
+            await communicator.disconnect()
+            return received
+
+        return async_to_sync(run)()
+
+    def test_decodes_event_type(self):
+        assert self._received_types("event_type=swap%20done", ["swap", "swap done"]) == ["swap done"]
+
+    def test_ignores_event_type_inside_other_values(self):
+        assert self._received_types("foo=event_type=bar", ["swap", "bar"]) == ["swap", "bar"]
+
+    def test_missing_event_type(self):
+        assert self._received_types("", ["swap"]) == ["swap"]
+
+    def test_forwards_pre_serialized_text(self):
+        from channels.layers import get_channel_layer
+        from channels.routing import URLRouter
+        from channels.testing import WebsocketCommunicator
+
+        from soroscan.ingest.routing import websocket_urlpatterns
+
+        async def run():
+            communicator = WebsocketCommunicator(
+                URLRouter(websocket_urlpatterns), f"/ws/events/{self.CONTRACT_ID}/"
+            )
+            await communicator.connect()
+            await get_channel_layer().group_send(
+                event_group_name(self.CONTRACT_ID),
+                {"type": "contract_event", "data": {}, "text": '{"pre": "encoded"}'},
+            )
+            text = await communicator.receive_from()
+            await communicator.disconnect()
+            return text
+
+        assert async_to_sync(run)() == '{"pre": "encoded"}'
+
+
+class TestEventGroupName:
+    def test_contract_group(self):
+        assert event_group_name("CABC") == "events_CABC"
+
+    def test_event_type_group(self):
+        assert event_group_name("CABC", "swap") == "events_CABC_swap"
+
+    def test_unsafe_event_type_is_hashed(self):
+        name = event_group_name("C" + "A" * 55, "swap done/" + "x" * 80)
+        assert len(name) < 100
+        assert re.fullmatch(r"[A-Za-z0-9_.-]+", name)
+
+
+class TestEncodeEvent:
+    def test_round_trips_json(self):
+        data = {"event_type": "swap", "payload": {"amount": 5}}
+        assert json.loads(encode_event(data)) == data
+
+    def test_handles_integers_wider_than_64_bits(self):
+        data = {"payload": {"amount": 2**127}}
+        assert json.loads(encode_event(data)) == data
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"event_type": "swap", "payload": {"amount": 5, "ratio": 0.25, "ok": True, "memo": None}},
+            {"payload": {"symbol": "ÜSD€", "note": "quote \" and \\ slash\n", "tags": ["a", "ß"]}},
+            {"ledger": 2**63 - 1, "nested": {"list": [1, -2, 3.5e-7, [], {}]}},
+        ],
+    )
+    def test_matches_orjson_output(self, data):
+        assert encode_event(data).encode() == orjson.dumps(data)
+
+    def test_wide_integers_keep_the_orjson_format(self):
+        data = {"payload": {"amount": 2**127, "debt": -(2**100), "ratio": 3.5e-7, "symbol": "€"}}
+        # Everything but the wide integers is rendered exactly as orjson would.
+        assert encode_event(data) == '{"payload":{"amount":%d,"debt":%d,"ratio":3.5e-7,"symbol":"€"}}' % (
+            2**127,
+            -(2**100),
+        )
+        assert json.loads(encode_event(data)) == data
@@ -136,6 +136,28 @@ class TestImportJSON:
         assert result.errors == 1
         assert result.imported == 0
 
+    def test_import_invalid_payload_hash_records_error_and_keeps_batch(self):
+        contract = TrackedContractFactory()
+        rows = json.dumps([
+            {
+                "contract_id": contract.contract_id,
+                "event_type": "test",
+                "payload": "{}",
+                "payload_hash": payload_hash,
+                "ledger": 1,
+                "event_index": index,
+                "timestamp": "2024-01-01T00:00:00+00:00",
+            }
+            for index, payload_hash in enumerate(["abc", "a" * 64])
+        ])
+
+        result = import_json(io.StringIO(rows), ImportResult())
+
+        assert result.errors == 1
+        assert "payload_hash" in result.error_details[0]
+        assert result.imported == 1
+        assert ContractEvent.objects.get().event_index == 1
+
 
 @pytest.mark.django_db
 class TestImportCSV:
@@ -0,0 +1,132 @@
+"""
+Round-trip tests for the PostgreSQL-specific ContractEvent migrations.
+
+Each test migrates the ingest app back to the state it needs, checks the
+forward and reverse database changes, and leaves the schema at the leaf.
+"""
+import hashlib
+from datetime import UTC, datetime
+
+import pytest
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+
+from .factories import TrackedContractFactory, UserFactory
+
+pytestmark = [pytest.mark.postgres, pytest.mark.django_db(transaction=True)]
+
+
+@pytest.fixture
+def migrate():
+    """Migrate ingest to a named migration and return that state's apps."""
+
+    def _migrate(name):
+        executor = MigrationExecutor(connection)
+        target = ("ingest", name)
+        executor.migrate([target])
+        return executor.loader.project_state([target]).apps
+
+    yield _migrate
+
+    executor = MigrationExecutor(connection)
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+
+def _column_type(table, column):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT data_type FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
+            [table, column],
+        )
+        return cursor.fetchone()[0]
+
+
+def _index_definitions(table):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s", [table])
+        return dict(cursor.fetchall())
+
+
+class TestPayloadHashBytesMigration:
+    def test_hashes_round_trip_through_bytea(self, migrate):
+        contract = TrackedContractFactory(owner=UserFactory())
+        ContractEvent = migrate("0033_contractevent_contract_id_idx").get_model("ingest", "ContractEvent")
+        seeds = {
+            "lower": ("ab" * 32, {"amount": 1}),
+            "upper": ("CD" * 32, {"amount": 2}),
+            "mixed": ("aB" * 32, {"amount": 3}),
+            "not_hex": ("not-a-hash", {"amount": 4}),
+            "odd_length": ("abc", {"amount": 5}),
+            "not_hex_without_payload": ("zz", {}),
+            "empty": ("", {"amount": 6}),
+        }
+        ids = {}
+        for index, (label, (payload_hash, payload)) in enumerate(seeds.items()):
+            ids[label] = ContractEvent.objects.create(
+                contract_id=contract.pk,
+                event_type="transfer",
+                payload=payload,
+                payload_hash=payload_hash,
+                ledger=1_000 + index,
+                event_index=0,
+                timestamp=datetime(2024, 2, 19, 20, tzinfo=UTC),
+                tx_hash="f" * 64,
+            ).pk
+
+        ContractEvent = migrate("0034_contractevent_payload_hash_bytes").get_model("ingest", "ContractEvent")
+
+        table = ContractEvent._meta.db_table
+        assert _column_type(table, "payload_hash") == "bytea"
+        assert not any(name.endswith("_like") and "payload_hash" in name for name in _index_definitions(table))
+        hashes = dict(ContractEvent.objects.values_list("pk", "payload_hash"))
+        assert hashes[ids["lower"]] == "ab" * 32
+        assert hashes[ids["upper"]] == "cd" * 32
+        assert hashes[ids["mixed"]] == "ab" * 32
+        assert hashes[ids["not_hex"]] == hashlib.sha256(str({"amount": 4}).encode("utf-8")).hexdigest()
+        assert hashes[ids["odd_length"]] == hashlib.sha256(str({"amount": 5}).encode("utf-8")).hexdigest()
+        assert hashes[ids["not_hex_without_payload"]] == ""
+        assert hashes[ids["empty"]] == ""
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT payload_hash FROM {table} WHERE id = %s", [ids["upper"]])
+            assert bytes(cursor.fetchone()[0]) == bytes.fromhex("cd" * 32)
+
+        ContractEvent = migrate("0033_contractevent_contract_id_idx").get_model("ingest", "ContractEvent")
+
+        assert _column_type(table, "payload_hash") == "character varying"
+        assert any(
+            "payload_hash varchar_pattern_ops" in definition for definition in _index_definitions(table).values()
+        )
+        assert dict(ContractEvent.objects.values_list("pk", "payload_hash")) == hashes
+
+
+class TestContractEventIndexMigrations:
+    TABLE = "ingest_contractevent"
+
+    def _assert_postgres_indexes(self, indexes):
+        assert "USING brin" in indexes["ingest_cont_ts_brin"]
+        assert "pages_per_range='32'" in indexes["ingest_cont_ts_brin"]
+        assert "USING gin (payload jsonb_path_ops)" in indexes["ingest_cont_payload_gin"]
+        assert "USING hash (tx_hash)" in indexes["ingest_cont_tx_hash_hash"]
+        assert "ingest_contractevent_payload_gin" not in indexes
+        assert "ingest_cont_tx_hash_24128c_idx" not in indexes
+
+    def test_indexes_round_trip(self, migrate):
+        self._assert_postgres_indexes(_index_definitions(self.TABLE))
+
+        migrate("0034_contractevent_payload_hash_bytes")
+
+        indexes = _index_definitions(self.TABLE)
+        assert not {"ingest_cont_ts_brin", "ingest_cont_payload_gin", "ingest_cont_tx_hash_hash"} & set(indexes)
+        assert "USING gin (payload)" in indexes["ingest_contractevent_payload_gin"]
+        assert "USING btree (tx_hash)" in indexes["ingest_cont_tx_hash_24128c_idx"]
+
+        migrate("0038_contractevent_tx_hash_hash_index")
+
+        self._assert_postgres_indexes(_index_definitions(self.TABLE))
+
+    def test_tx_hash_lookup_uses_hash_index(self):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN SELECT id FROM {self.TABLE} WHERE tx_hash = %s", ["f" * 64])
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        assert "ingest_cont_tx_hash_hash" in plan
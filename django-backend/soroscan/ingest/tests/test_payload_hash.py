@@ -0,0 +1,45 @@
+import hashlib
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+
+from soroscan.ingest.models import ContractEvent, validate_hex_digest
+
+from .factories import ContractEventFactory
+
+
+@pytest.mark.django_db
+class TestPayloadHashStorage:
+    def test_auto_computed_hash_round_trips_as_hex(self, contract):
+        event = ContractEventFactory(contract=contract, payload={"amount": 1}, payload_hash="")
+        expected = hashlib.sha256(str({"amount": 1}).encode("utf-8")).hexdigest()
+
+        event.refresh_from_db()
+        assert event.payload_hash == expected
+        assert ContractEvent.objects.filter(payload_hash=expected).get() == event
+
+    def test_hash_is_stored_as_raw_bytes(self, contract):
+        digest = "ab" * 32
+        event = ContractEventFactory(contract=contract, payload_hash=digest)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT payload_hash FROM {ContractEvent._meta.db_table} WHERE id = %s",
+                [event.id],
+            )
+            (stored,) = cursor.fetchone()
+
+        assert bytes(stored) == bytes.fromhex(digest)
+        assert ContractEvent.objects.values_list("payload_hash", flat=True).get(id=event.id) == digest
+
+    def test_non_hex_hash_is_rejected(self, contract):
+        with pytest.raises(ValueError, match="hex-encoded digest"):
+            ContractEventFactory(contract=contract, payload_hash="not-a-digest")
+
+    @pytest.mark.parametrize("value", ["abc", "not-a-digest", "ab cd"])
+    def test_validator_rejects_non_hex_digests(self, value):
+        with pytest.raises(ValidationError):
+            validate_hex_digest(value)
+        with pytest.raises(ValidationError):
+            ContractEvent._meta.get_field("payload_hash").run_validators(value)
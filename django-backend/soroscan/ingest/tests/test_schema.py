@@ -1,11 +1,38 @@
 import pytest
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from soroscan.ingest.schema import schema
+from soroscan.ingest.models import ContractEvent
+from soroscan.ingest.schema import _distinct_event_types, schema
 from .factories import ContractEventFactory, TrackedContractFactory, UserFactory
 
+# Shared documents take their inputs as variables, so the schema's parser and
+# validation caches can reuse them across tests instead of re-parsing.
+CONTRACT_WARNINGS_QUERY = """
+    query ContractWarnings($contractId: String!) {
+        contract(contractId: $contractId) {
+            contractId
+            warnings {
+                type
+                message
+            }
+        }
+    }
+"""
+
+EVENTS_PAGE_QUERY = """
+    query EventsPage($first: Int!, $after: String) {
+        events(first: $first, after: $after) {
+            edges { node { id } cursor }
+            pageInfo { hasNextPage endCursor }
+            totalCount
+        }
+    }
+"""
+
 
 @pytest.fixture
 def user():
@@ -59,6 +86,26 @@ class TestGraphQLQueries:
         assert len(result.data["contracts"]) == 1
         assert result.data["contracts"][0]["isActive"] is True
 
+    def test_query_contracts_event_count_is_annotated(self, contract, django_assert_num_queries):
+        ContractEventFactory(contract=contract)
+        ContractEventFactory(contract=contract)
+        TrackedContractFactory(owner=contract.owner)
+
+        query = """
+            query {
+                contracts {
+                    contractId
+                    eventCount
+                }
+            }
+        """
+        with django_assert_num_queries(1):
+            result = schema.execute_sync(query)
+        assert result.errors is None
+        counts = {item["contractId"]: item["eventCount"] for item in result.data["contracts"]}
+        assert counts[contract.contract_id] == 2
+        assert sorted(counts.values()) == [0, 2]
+
     def test_schema_has_subscription_type(self):
         """Test that the schema includes subscription type."""
         # Verify the schema has a subscription type
@@ -101,18 +148,7 @@ class TestGraphQLQueries:
         contract.deprecation_reason = "This contract is deprecated."
         contract.save(update_fields=["deprecation_status", "deprecation_reason"])
 
-        query = f"""
-            query {{
-                contract(contractId: "{contract.contract_id}") {{
-                    contractId
-                    warnings {{
-                        type
-                        message
-                    }}
-                }}
-            }}
-        """
-        result = schema.execute_sync(query)
+        result = schema.execute_sync(CONTRACT_WARNINGS_QUERY, variable_values={"contractId": contract.contract_id})
 
         assert result.errors is None
         assert result.data["contract"]["warnings"] == [
@@ -123,18 +159,7 @@ class TestGraphQLQueries:
         ]
 
     def test_contract_query_returns_empty_warnings_for_active_contract(self, contract):
-        query = f"""
-            query {{
-                contract(contractId: "{contract.contract_id}") {{
-                    contractId
-                    warnings {{
-                        type
-                        message
-                    }}
-                }}
-            }}
-        """
-        result = schema.execute_sync(query)
+        result = schema.execute_sync(CONTRACT_WARNINGS_QUERY, variable_values={"contractId": contract.contract_id})
 
         assert result.errors is None
         assert result.data["contract"]["warnings"] == []
@@ -169,6 +194,38 @@ class TestGraphQLQueries:
         assert len(result.data["events"]["edges"]) == 2
         assert result.data["events"]["totalCount"] == 2
 
+    def test_query_events_defers_unselected_columns(self, contract):
+        ContractEventFactory(contract=contract, raw_xdr="AAAA")
+
+        narrow = """
+            query {
+                events(first: 10) {
+                    edges { node { id eventType } }
+                }
+            }
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            result = schema.execute_sync(narrow)
+        assert result.errors is None
+        select_sql = ctx.captured_queries[-1]["sql"]
+        assert "raw_xdr" not in select_sql
+        assert '"payload"' not in select_sql
+
+        wide = """
+            query {
+                events(first: 10) {
+                    edges { ... on EventEdge { node { id payload } } }
+                }
+            }
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            result = schema.execute_sync(wide)
+        assert result.errors is None
+        assert result.data["events"]["edges"][0]["node"]["payload"] == {"amount": 100, "from": "Alice", "to": "Bob"}
+        select_sql = ctx.captured_queries[-1]["sql"]
+        assert "raw_xdr" not in select_sql
+        assert '"payload"' in select_sql
+
     def test_query_events_filter_by_contract(self, contract):
         other_contract = TrackedContractFactory(owner=contract.owner)
         ContractEventFactory(contract=contract)
@@ -208,16 +265,7 @@ class TestGraphQLQueries:
         for _ in range(5):
             ContractEventFactory(contract=contract)
         
-        query = """
-            query {
-                events(first: 2) {
-                    edges { node { id } cursor }
-                    pageInfo { hasNextPage endCursor }
-                    totalCount
-                }
-            }
-        """
-        result = schema.execute_sync(query)
+        result = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 2})
         assert result.errors is None
         assert len(result.data["events"]["edges"]) == 2
         assert result.data["events"]["pageInfo"]["hasNextPage"] is True
@@ -227,15 +275,7 @@ class TestGraphQLQueries:
         for _ in range(10):
             ContractEventFactory(contract=contract)
         
-        query = """
-            query {
-                events(first: 5000) {
-                    edges { node { id } }
-                    totalCount
-                }
-            }
-        """
-        result = schema.execute_sync(query)
+        result = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 5000})
         assert result.errors is None
         assert len(result.data["events"]["edges"]) == 10
         assert result.data["events"]["totalCount"] == 10
@@ -310,7 +350,12 @@ class TestGraphQLQueries:
         """
         result = schema.execute_sync(query)
         assert result.errors is None
-        assert set(result.data["eventTypes"]) == {"transfer", "mint"}
+        assert result.data["eventTypes"] == ["mint", "transfer"]
+
+    def test_query_event_types_unknown_contract(self):
+        result = schema.execute_sync('query { eventTypes(contractId: "CUNKNOWN") }')
+        assert result.errors is None
+        assert result.data["eventTypes"] == []
 
     def test_query_event_timeline_groups_events(self, contract):
         ContractEventFactory(
@@ -424,51 +469,47 @@ class TestGraphQLQueries:
         assert result.data["eventTimeline"]["groups"][0]["eventCount"] == 1
         assert result.data["eventTimeline"]["groups"][0]["events"] == []
 
+    def test_query_event_timeline_events_load_without_per_event_queries(self, contract, django_assert_num_queries):
+        now = timezone.now()
+        for minutes in range(0, 90, 10):
+            ContractEventFactory(contract=contract, timestamp=now - timedelta(minutes=minutes))
+
+        query = f"""
+            query {{
+                eventTimeline(contractId: "{contract.contract_id}", bucketSize: FIVE_MINUTES) {{
+                    groups {{
+                        events {{ id contractId contractName payload decodingStatus }}
+                    }}
+                }}
+            }}
+        """
+        # One query for the contract, one for its events.
+        with django_assert_num_queries(2):
+            result = schema.execute_sync(query)
+
+        assert result.errors is None
+        events = [e for g in result.data["eventTimeline"]["groups"] for e in g["events"]]
+        assert len(events) == 9
+        assert {e["contractName"] for e in events} == {contract.name}
+
     def test_cursor_pagination_forward(self, contract):
         for _ in range(5):
             ContractEventFactory(contract=contract)
 
-        query1 = """
-            query {
-                events(first: 2) {
-                    edges { node { id } cursor }
-                    pageInfo { hasNextPage endCursor }
-                    totalCount
-                }
-            }
-        """
-        r1 = schema.execute_sync(query1)
+        r1 = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 2})
         assert r1.errors is None
         assert len(r1.data["events"]["edges"]) == 2
         assert r1.data["events"]["pageInfo"]["hasNextPage"] is True
         assert r1.data["events"]["totalCount"] == 5
 
         cursor = r1.data["events"]["pageInfo"]["endCursor"]
-        query2 = f"""
-            query {{
-                events(first: 2, after: "{cursor}") {{
-                    edges {{ node {{ id }} cursor }}
-                    pageInfo {{ hasNextPage endCursor }}
-                    totalCount
-                }}
-            }}
-        """
-        r2 = schema.execute_sync(query2)
+        r2 = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 2, "after": cursor})
         assert r2.errors is None
         assert len(r2.data["events"]["edges"]) == 2
         assert r2.data["events"]["pageInfo"]["hasNextPage"] is True
 
         cursor2 = r2.data["events"]["pageInfo"]["endCursor"]
-        query3 = f"""
-            query {{
-                events(first: 2, after: "{cursor2}") {{
-                    edges {{ node {{ id }} cursor }}
-                    pageInfo {{ hasNextPage endCursor }}
-                    totalCount
-                }}
-            }}
-        """
-        r3 = schema.execute_sync(query3)
+        r3 = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 2, "after": cursor2})
         assert r3.errors is None
         assert len(r3.data["events"]["edges"]) == 1
         assert r3.data["events"]["pageInfo"]["hasNextPage"] is False
@@ -476,15 +517,7 @@ class TestGraphQLQueries:
     def test_first_zero_returns_empty(self, contract):
         ContractEventFactory(contract=contract)
 
-        query = """
-            query {
-                events(first: 0) {
-                    edges { node { id } }
-                    totalCount
-                }
-            }
-        """
-        result = schema.execute_sync(query)
+        result = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 0})
         assert result.errors is None
         assert len(result.data["events"]["edges"]) == 0
         assert result.data["events"]["totalCount"] == 1
@@ -492,15 +525,7 @@ class TestGraphQLQueries:
     def test_invalid_cursor_ignored(self, contract):
         ContractEventFactory(contract=contract)
 
-        query = """
-            query {
-                events(first: 10, after: "invalid-cursor") {
-                    edges { node { id } }
-                    totalCount
-                }
-            }
-        """
-        result = schema.execute_sync(query)
+        result = schema.execute_sync(EVENTS_PAGE_QUERY, variable_values={"first": 10, "after": "invalid-cursor"})
         assert result.errors is None
         assert len(result.data["events"]["edges"]) == 1
 
@@ -569,6 +594,46 @@ class TestGraphQLQueries:
             other_contract.contract_id,
         }
 
+@pytest.mark.postgres
+class TestDistinctEventTypesLooseIndexScan:
+    def _orm_distinct(self, contract):
+        return list(
+            ContractEvent.objects.filter(contract=contract)
+            .order_by("event_type")
+            .values_list("event_type", flat=True)
+            .distinct()
+        )
+
+    def test_matches_orm_distinct(self, contract):
+        other = TrackedContractFactory(owner=contract.owner)
+        event_types = ["transfer", "mint", "Burn", "approve", "mint", "swap_v2", "transfer", "Ünicode", "a b"]
+        ContractEventFactory.create_batch_bulk(
+            [{"contract": contract, "event_type": event_type} for event_type in event_types]
+            + [{"contract": other, "event_type": event_type} for event_type in ("zzz", "aaa")]
+        )
+
+        result = _distinct_event_types(contract.pk)
+
+        assert result == self._orm_distinct(contract)
+        assert sorted(result) == sorted(set(event_types))
+
+    def test_single_type(self, contract):
+        ContractEventFactory.create_batch_bulk([{"contract": contract, "event_type": "mint"}] * 3)
+        assert _distinct_event_types(contract.pk) == ["mint"]
+
+    def test_contract_without_events(self, contract):
+        assert _distinct_event_types(contract.pk) == []
+
+    def test_graphql_field_uses_it(self, contract):
+        ContractEventFactory(contract=contract, event_type="transfer")
+        ContractEventFactory(contract=contract, event_type="mint")
+
+        result = schema.execute_sync(f'query {{ eventTypes(contractId: "{contract.contract_id}") }}')
+
+        assert result.errors is None
+        assert result.data["eventTypes"] == self._orm_distinct(contract)
+
+
 @pytest.mark.django_db
 class TestGraphQLMutations:
     def test_register_contract(self, user):
@@ -3,7 +3,8 @@ Tests for Celery tasks — webhook dispatch, retry logic, HMAC signing, suspensi
 """
 import hashlib
 import hmac
-from datetime import timedelta
+import json
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,15 +12,20 @@ import requests
 import requests.exceptions
 import responses
 from celery.exceptions import Retry
+from django.core.cache import cache
 from django.utils import timezone
 
-from soroscan.ingest.models import AdminAction, EventDeduplicationLog, RemediationIncident, RemediationRule, WebhookDeliveryLog, WebhookSubscription
+from soroscan.ingest.cache_utils import HOURLY_AGGREGATE_WATERMARK_KEY
+from soroscan.ingest.models import AdminAction, ContractEvent, ContractEventHourly, EventDeduplicationLog, RemediationIncident, RemediationRule, WebhookDeliveryLog, WebhookSubscription
 from soroscan.ingest.tasks import (
+    _aggregate_watermark,
+    _recount_hourly_rollup,
     cleanup_old_dedup_logs,
     cleanup_webhook_delivery_logs,
     dispatch_webhook,
     evaluate_remediation_rules,
     process_new_event,
+    refresh_contract_event_hourly,
     validate_contract_payload_schema,
     validate_event_payload,
 )
@@ -89,6 +95,19 @@ class TestValidateEventPayload:
         assert passed is False
         assert version is not None
 
+    def test_edited_schema_is_not_served_stale(self, contract):
+        schema = EventSchemaFactory(
+            contract=contract,
+            event_type="swap",
+            json_schema={"type": "object", "required": ["amount"]},
+        )
+        assert validate_event_payload(contract, "swap", {"amount": 1})[0] is True
+
+        schema.json_schema = {"type": "object", "required": ["fee"]}
+        schema.save()
+
+        assert validate_event_payload(contract, "swap", {"amount": 1})[0] is False
+
     def test_no_schema_passes(self, contract):
         payload = {"any": "data"}
 
@@ -529,6 +548,31 @@ class TestProcessNewEvent:
         result = process_new_event.apply(args=[{"event_type": "swap"}])
         assert result.successful()
 
+    def test_process_event_fans_out_to_contract_and_event_type_groups(self, contract):
+        layer = Mock()
+        with patch("channels.layers.get_channel_layer", return_value=layer), \
+                patch("asgiref.sync.async_to_sync", side_effect=lambda fn: fn):
+            process_new_event.apply(
+                args=[{"contract_id": contract.contract_id, "event_type": "swap"}]
+            )
+
+        groups = [call.args[0] for call in layer.group_send.call_args_list]
+        assert groups == [
+            f"events_{contract.contract_id}",
+            f"events_{contract.contract_id}_swap",
+        ]
+
+    def test_process_event_pre_serializes_broadcast(self, contract):
+        layer = Mock()
+        event_data = {"contract_id": contract.contract_id, "event_type": "swap"}
+        with patch("channels.layers.get_channel_layer", return_value=layer), \
+                patch("asgiref.sync.async_to_sync", side_effect=lambda fn: fn):
+            process_new_event.apply(args=[event_data])
+
+        message = layer.group_send.call_args.args[1]
+        assert message.keys() == {"type", "text"}
+        assert json.loads(message["text"]) == event_data
+
     @responses.activate
     def test_process_event_no_matching_webhooks(self, contract):
         event = ContractEventFactory(
@@ -845,3 +889,98 @@ class TestEvaluateRemediationRules:
         incident = RemediationIncident.objects.get(rule=rule, contract=contract)
         assert incident.status == RemediationIncident.STATUS_RESOLVED
         assert AdminAction.objects.filter(action="remediation_resolved").exists()
+
+
+class TestAggregateWatermark:
+    NOW = datetime(2024, 2, 20, 12, 7, 30, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        ("grace", "expected"),
+        [
+            (0, datetime(2024, 2, 20, 12, 5, tzinfo=UTC)),
+            (600, datetime(2024, 2, 20, 11, 55, tzinfo=UTC)),
+        ],
+    )
+    def test_watermark_lags_by_grace(self, grace, expected):
+        from django.test import override_settings
+
+        with override_settings(AGGREGATE_WATERMARK_GRACE_SECONDS=grace), patch(
+            "soroscan.ingest.tasks.timezone.now", return_value=self.NOW
+        ):
+            assert _aggregate_watermark(300) == expected
+
+    def test_hourly_watermark_lags_by_grace(self):
+        from django.test import override_settings
+
+        with override_settings(AGGREGATE_WATERMARK_GRACE_SECONDS=600), patch(
+            "soroscan.ingest.tasks.timezone.now", return_value=datetime(2024, 2, 20, 12, 4, tzinfo=UTC)
+        ):
+            assert _aggregate_watermark(3_600) == datetime(2024, 2, 20, 11, 0, tzinfo=UTC)
+
+
+@pytest.mark.django_db
+class TestRefreshContractEventHourly:
+    BASE = datetime(2024, 2, 19, 20, 0, tzinfo=UTC)
+
+    def _rollup(self):
+        return {
+            (row.contract_id, row.bucket, row.event_type): row.event_count
+            for row in ContractEventHourly.objects.all()
+        }
+
+    def _expected(self):
+        counts = {}
+        for contract_pk, timestamp, event_type in ContractEvent.objects.values_list(
+            "contract_id", "timestamp", "event_type"
+        ):
+            key = (contract_pk, timestamp.replace(minute=0, second=0, microsecond=0), event_type)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def test_counts_every_event_on_first_run(self, contract):
+        for minutes in range(0, 300, 17):
+            ContractEventFactory(
+                contract=contract,
+                event_type=("mint", "burn")[minutes % 2],
+                timestamp=self.BASE + timedelta(minutes=minutes),
+            )
+
+        result = refresh_contract_event_hourly()
+
+        assert result["through_id"] == ContractEvent.objects.order_by("-id").values_list("id", flat=True).first()
+        assert self._rollup() == self._expected()
+
+    def test_backfill_below_watermark_is_counted_by_next_run(self, contract):
+        ContractEventFactory(contract=contract, event_type="mint", timestamp=self.BASE + timedelta(minutes=5))
+        refresh_contract_event_hourly()
+
+        ContractEventFactory(contract=contract, event_type="mint", timestamp=self.BASE + timedelta(minutes=40))
+        ContractEventFactory(contract=contract, event_type="burn", timestamp=self.BASE - timedelta(days=30))
+        refresh_contract_event_hourly()
+
+        assert self._rollup() == self._expected()
+        assert self._rollup()[(contract.id, self.BASE, "mint")] == 2
+
+    def test_idle_runs_stop_recounting(self, contract):
+        ContractEventFactory(contract=contract, timestamp=self.BASE)
+        refresh_contract_event_hourly()
+        # The second run rescans the first run's ids in case of late commits.
+        assert refresh_contract_event_hourly()["recounted_slots"] == 1
+        assert refresh_contract_event_hourly()["recounted_slots"] == 0
+
+    def test_publishes_watermark_and_cursor(self, contract):
+        event = ContractEventFactory(contract=contract, timestamp=self.BASE)
+        with patch("soroscan.ingest.tasks.timezone.now", return_value=datetime(2024, 2, 20, 12, 4, tzinfo=UTC)):
+            refresh_contract_event_hourly()
+
+        assert cache.get(HOURLY_AGGREGATE_WATERMARK_KEY) == (datetime(2024, 2, 20, 11, 0, tzinfo=UTC), event.id)
+
+    def test_recount_after_delete_drops_removed_events(self, contract):
+        kept = ContractEventFactory(contract=contract, event_type="mint", timestamp=self.BASE)
+        removed = ContractEventFactory(contract=contract, event_type="burn", timestamp=self.BASE + timedelta(minutes=1))
+        refresh_contract_event_hourly()
+
+        ContractEvent.objects.filter(pk=removed.pk).delete()
+        _recount_hourly_rollup([(contract.id, removed.timestamp)])
+
+        assert self._rollup() == {(contract.id, self.BASE, kept.event_type): 1}
@@ -1,9 +1,27 @@
-from datetime import UTC, datetime
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
-from soroscan.ingest.services.timeline import build_timeline, clamp_group_limit
+from soroscan.ingest.cache_utils import HOURLY_AGGREGATE_WATERMARK_KEY
+from soroscan.ingest.models import ContractEvent, ContractEventHourly
+from soroscan.ingest.services.timeline import (
+    _LOCAL_EPOCH,
+    _aggregate_source,
+    _LocalBucketEpoch,
+    _group_bucket_counts,
+    _group_events,
+    build_timeline,
+    clamp_group_limit,
+    floor_bucket_start,
+    resolve_tz,
+    warm_timezone_cache,
+)
+from soroscan.ingest.tasks import refresh_contract_event_hourly
 
 from .factories import ContractEventFactory, TrackedContractFactory, UserFactory
 
@@ -18,26 +36,19 @@ class TestTimelineService:
         user = UserFactory()
         contract = TrackedContractFactory(owner=user)
 
-        ContractEventFactory(
-            contract=contract,
-            event_type="transfer",
-            timestamp=timezone.make_aware(datetime(2024, 2, 19, 20, 1, 0), UTC),
-            ledger=2000,
-            event_index=0,
-        )
-        ContractEventFactory(
-            contract=contract,
-            event_type="transfer",
-            timestamp=timezone.make_aware(datetime(2024, 2, 19, 20, 4, 0), UTC),
-            ledger=2001,
-            event_index=0,
-        )
-        ContractEventFactory(
-            contract=contract,
-            event_type="approve",
-            timestamp=timezone.make_aware(datetime(2024, 2, 19, 20, 6, 0), UTC),
-            ledger=2002,
-            event_index=0,
+        ContractEventFactory.create_batch_bulk(
+            [
+                {
+                    "contract": contract,
+                    "event_type": event_type,
+                    "timestamp": datetime(2024, 2, 19, 20, minute, tzinfo=UTC),
+                    "ledger": ledger,
+                    "event_index": 0,
+                }
+                for ledger, (minute, event_type) in enumerate(
+                    [(1, "transfer"), (4, "transfer"), (6, "approve")], start=2000
+                )
+            ]
         )
 
         timeline = build_timeline(
@@ -99,7 +110,195 @@ class TestTimelineService:
         )
 
         assert timeline.total_events == 1
-        assert timeline.groups[0].events == []
+        assert timeline.groups[0].events == ()
+
+    def test_count_only_timeline_for_past_window_is_cached(self, django_assert_num_queries):
+        cache.clear()
+        contract = TrackedContractFactory(owner=UserFactory())
+        base = datetime(2024, 2, 19, 20, 0, tzinfo=UTC)
+        ContractEventFactory(contract=contract, timestamp=base + timedelta(minutes=1))
+        kwargs = {
+            "contract_id": contract.contract_id,
+            "bucket_seconds": 300,
+            "event_types": None,
+            "since": None,
+            "until": base + timedelta(hours=1),
+            "timezone_name": "UTC",
+        }
+
+        first = build_timeline(**kwargs)
+        # Only the latest event id lookup for the cache key.
+        with django_assert_num_queries(1):
+            cached = build_timeline(**kwargs)
+        assert cached.total_events == first.total_events == 1
+
+    def test_backfill_into_cached_window_misses_cache(self):
+        cache.clear()
+        contract = TrackedContractFactory(owner=UserFactory())
+        base = datetime(2024, 2, 19, 20, 0, tzinfo=UTC)
+        ContractEventFactory(contract=contract, timestamp=base + timedelta(minutes=1))
+        kwargs = {
+            "contract_id": contract.contract_id,
+            "bucket_seconds": 300,
+            "event_types": None,
+            "since": None,
+            "until": base + timedelta(hours=1),
+            "timezone_name": "UTC",
+        }
+
+        assert build_timeline(**kwargs).total_events == 1
+        ContractEventFactory(contract=contract, timestamp=base + timedelta(minutes=2))
+        assert build_timeline(**kwargs).total_events == 2
+
+    def test_count_only_timeline_up_to_now_is_not_cached(self):
+        cache.clear()
+        contract = TrackedContractFactory(owner=UserFactory())
+        ContractEventFactory(contract=contract, timestamp=timezone.now() - timedelta(minutes=5))
+        kwargs = {
+            "contract_id": contract.contract_id,
+            "bucket_seconds": 300,
+            "event_types": None,
+            "since": None,
+            "until": None,
+            "timezone_name": "UTC",
+        }
+
+        assert build_timeline(**kwargs).total_events == 1
+        ContractEventFactory(contract=contract, timestamp=timezone.now() - timedelta(minutes=1))
+        assert build_timeline(**kwargs).total_events == 2
+
+    def test_count_only_timeline_ending_inside_grace_period_is_not_cached(self, settings):
+        cache.clear()
+        settings.AGGREGATE_WATERMARK_GRACE_SECONDS = 600
+        contract = TrackedContractFactory(owner=UserFactory())
+        until = timezone.now() - timedelta(minutes=2)
+        ContractEventFactory(contract=contract, timestamp=until - timedelta(minutes=5))
+        kwargs = {
+            "contract_id": contract.contract_id,
+            "bucket_seconds": 300,
+            "event_types": None,
+            "since": None,
+            "until": until,
+            "timezone_name": "UTC",
+        }
+
+        assert build_timeline(**kwargs).total_events == 1
+        # A late commit landing in the already-ended window is still seen.
+        ContractEventFactory(contract=contract, timestamp=until - timedelta(minutes=1))
+        assert build_timeline(**kwargs).total_events == 2
+
+    def test_group_limit_keeps_newest_groups_and_full_total(self):
+        contract = TrackedContractFactory(owner=UserFactory())
+        base = datetime(2024, 2, 19, 20, 0, tzinfo=UTC)
+        for minutes in (1, 6, 11, 12, 16):
+            ContractEventFactory(contract=contract, timestamp=base + timedelta(minutes=minutes))
+
+        timeline = build_timeline(
+            contract_id=contract.contract_id,
+            bucket_seconds=300,
+            event_types=None,
+            since=base,
+            until=base + timedelta(minutes=20),
+            timezone_name="UTC",
+            limit_groups=2,
+            include_events=True,
+        )
+
+        assert timeline.total_events == 5
+        assert [group.start for group in timeline.groups] == [
+            base + timedelta(minutes=15),
+            base + timedelta(minutes=10),
+        ]
+        assert [len(group.events) for group in timeline.groups] == [1, 2]
+
+    def test_group_events_keep_newest_first_order(self):
+        contract = TrackedContractFactory(owner=UserFactory())
+        timestamp = datetime(2024, 2, 19, 20, 1, tzinfo=UTC)
+        ContractEventFactory(contract=contract, timestamp=timestamp, ledger=10, event_index=0)
+        ContractEventFactory(contract=contract, timestamp=timestamp, ledger=11, event_index=1)
+        ContractEventFactory(contract=contract, timestamp=timestamp + timedelta(minutes=2), ledger=12, event_index=0)
+
+        timeline = build_timeline(
+            contract_id=contract.contract_id,
+            bucket_seconds=300,
+            event_types=None,
+            since=timestamp - timedelta(minutes=1),
+            until=timestamp + timedelta(minutes=3),
+            timezone_name="UTC",
+            include_events=True,
+        )
+
+        assert [event.ledger for event in timeline.groups[0].events] == [12, 11, 10]
+
+    def test_events_share_one_contract_instance(self):
+        contract = TrackedContractFactory(owner=UserFactory())
+        for _ in range(3):
+            ContractEventFactory(contract=contract, timestamp=timezone.now())
+
+        timeline = build_timeline(
+            contract_id=contract.contract_id,
+            bucket_seconds=86_400,
+            event_types=None,
+            since=None,
+            until=None,
+            timezone_name="UTC",
+            include_events=True,
+        )
+
+        events = [event for group in timeline.groups for event in group.events]
+        assert len(events) == 3
+        assert len({id(event.contract) for event in events}) == 1
+        assert events[0].contract.name == contract.name
+
+    def test_include_events_for_unknown_contract_is_empty(self):
+        timeline = build_timeline(
+            contract_id="CUNKNOWN",
+            bucket_seconds=300,
+            event_types=None,
+            since=None,
+            until=None,
+            timezone_name="UTC",
+            include_events=True,
+        )
+
+        assert timeline.total_events == 0
+        assert timeline.groups == []
+
+    def test_top_n_keeps_most_frequent_event_types(self):
+        contract = TrackedContractFactory(owner=UserFactory())
+        base = datetime(2024, 2, 19, 20, 0, tzinfo=UTC)
+        for minutes, event_type in enumerate(["mint", "burn", "burn", "transfer", "transfer", "transfer"]):
+            ContractEventFactory(contract=contract, event_type=event_type, timestamp=base + timedelta(minutes=minutes))
+
+        kwargs = {
+            "contract_id": contract.contract_id,
+            "bucket_seconds": 3600,
+            "event_types": None,
+            "since": base,
+            "until": base + timedelta(hours=1),
+            "timezone_name": "UTC",
+        }
+        top = build_timeline(**kwargs, top_n=2).groups[0]
+        full = build_timeline(**kwargs).groups[0]
+
+        assert [(item.event_type, item.count) for item in top.event_type_counts] == [
+            ("transfer", 3),
+            ("burn", 2),
+        ]
+        assert top.event_count == 6
+        assert len(full.event_type_counts) == 3
+
+    def test_non_positive_top_n_raises_error(self):
+        with pytest.raises(ValueError, match="top_n"):
+            build_timeline(
+                contract_id="C1",
+                bucket_seconds=300,
+                event_types=None,
+                since=None,
+                until=None,
+                timezone_name="UTC",
+                top_n=0,
+            )
 
     def test_invalid_timezone_raises_error(self):
         user = UserFactory()
@@ -116,6 +315,17 @@ class TestTimelineService:
                 include_events=False,
             )
 
+    def test_invalid_timezone_is_rejected_before_querying(self, django_assert_num_queries):
+        with django_assert_num_queries(0), pytest.raises(ValueError, match="Unsupported timezone"):
+            build_timeline(
+                contract_id="C1",
+                bucket_seconds=300,
+                event_types=None,
+                since=None,
+                until=None,
+                timezone_name="Mars/Olympus_Mons",
+            )
+
     def test_since_after_until_raises_error(self):
         user = UserFactory()
         contract = TrackedContractFactory(owner=user)
@@ -130,3 +340,320 @@ class TestTimelineService:
                 timezone_name="UTC",
                 include_events=False,
             )
+
+
+class TestGroupBucketCounts:
+    def test_rows_match_python_bucketing(self):
+        tz = ZoneInfo("Asia/Kolkata")
+        timestamp = datetime(2024, 2, 19, 20, 7, tzinfo=UTC)
+        expected_start = floor_bucket_start(timestamp=timestamp, bucket_seconds=1800, selected_timezone=tz)
+        local_epoch = int((expected_start.replace(tzinfo=None) - datetime(1970, 1, 1)).total_seconds())
+
+        groups = _group_bucket_counts(
+            rows=[(local_epoch, "transfer", 2), (local_epoch - 1800, "mint", 1), (local_epoch, "burn", 3)],
+            bucket_seconds=1800,
+            selected_timezone=tz,
+        )
+
+        assert [group.start for group in groups] == [expected_start, expected_start - timedelta(minutes=30)]
+        assert groups[0].event_count == 5
+        assert groups[0].event_type_counts == {"transfer": 2, "burn": 3}
+        assert groups[0].end - groups[0].start == timedelta(minutes=30)
+
+
+class TestAggregateSource:
+    WATERMARK = datetime(2024, 2, 20, 0, 0, tzinfo=UTC)
+
+    def setup_method(self):
+        cache.set(HOURLY_AGGREGATE_WATERMARK_KEY, (self.WATERMARK, 42))
+
+    def teardown_method(self):
+        cache.delete(HOURLY_AGGREGATE_WATERMARK_KEY)
+
+    def _source(self, since, until, bucket_seconds=3600, tz="UTC"):
+        return _aggregate_source(
+            since=since, until=until, bucket_seconds=bucket_seconds, selected_timezone=ZoneInfo(tz)
+        )
+
+    def test_covers_whole_hours_below_watermark(self):
+        since = datetime(2024, 2, 19, 20, 15, tzinfo=UTC)
+        until = datetime(2024, 2, 20, 3, 0, tzinfo=UTC)
+        assert self._source(since, until) == (
+            ContractEventHourly,
+            datetime(2024, 2, 19, 21, tzinfo=UTC),
+            self.WATERMARK,
+            42,
+        )
+
+    def test_skipped_without_watermark(self):
+        cache.delete(HOURLY_AGGREGATE_WATERMARK_KEY)
+        assert self._source(datetime(2024, 2, 19, tzinfo=UTC), self.WATERMARK) is None
+
+    def test_skipped_for_sub_hour_buckets(self):
+        assert self._source(datetime(2024, 2, 19, tzinfo=UTC), self.WATERMARK, bucket_seconds=1800) is None
+
+    def test_skipped_for_half_hour_offsets(self):
+        assert self._source(datetime(2024, 2, 19, tzinfo=UTC), self.WATERMARK, tz="Asia/Kolkata") is None
+
+
+def _reference_bucket_start(timestamp, bucket_seconds, selected_timezone):
+    """Floor on the local wall clock by plain arithmetic from local midnight."""
+    wall = timestamp.astimezone(selected_timezone).replace(tzinfo=None)
+    midnight = wall.replace(hour=0, minute=0, second=0, microsecond=0)
+    offset = int((wall - midnight).total_seconds()) // bucket_seconds * bucket_seconds
+    return (midnight + timedelta(seconds=offset)).replace(tzinfo=selected_timezone)
+
+
+_REFERENCE_CASES = [
+    ("UTC", 300, datetime(2024, 2, 19, 20, 3, tzinfo=UTC)),
+    ("Asia/Kolkata", 1800, datetime(2024, 2, 19, 20, 3, tzinfo=UTC)),
+    ("America/New_York", 3600, datetime(2024, 3, 9, 12, 0, tzinfo=UTC)),  # spans DST start
+    ("America/New_York", 300, datetime(2024, 11, 2, 12, 0, tzinfo=UTC)),  # spans DST end
+    ("America/New_York", 900, datetime(2024, 11, 2, 12, 0, tzinfo=UTC)),  # repeated 01:00 hour
+    ("America/New_York", 86_400, datetime(2024, 11, 2, 12, 0, tzinfo=UTC)),
+    ("Europe/Berlin", 1800, datetime(2024, 3, 30, 0, 0, tzinfo=UTC)),
+    ("Europe/Berlin", 5_400, datetime(2024, 10, 26, 0, 0, tzinfo=UTC)),
+    ("UTC", 7_000, datetime(2024, 2, 19, 20, 3, tzinfo=UTC)),  # does not tile the day
+    ("Asia/Kathmandu", 900, datetime(2024, 2, 19, 20, 3, tzinfo=UTC)),  # +05:45
+    ("Australia/Lord_Howe", 1800, datetime(2024, 4, 5, 0, 0, tzinfo=UTC)),  # 30-minute DST shift
+]
+
+
+class TestFloorBucketStartMatchesReference:
+    @pytest.mark.parametrize(("tz", "bucket_seconds", "since"), _REFERENCE_CASES)
+    def test_matches_reference(self, tz, bucket_seconds, since):
+        selected_timezone = ZoneInfo(tz)
+        timestamp = since
+        while timestamp <= since + timedelta(days=3):
+            expected = _reference_bucket_start(timestamp, bucket_seconds, selected_timezone)
+            actual = floor_bucket_start(
+                timestamp=timestamp, bucket_seconds=bucket_seconds, selected_timezone=selected_timezone
+            )
+            assert actual.isoformat() == expected.isoformat()
+            timestamp += timedelta(seconds=617)
+
+
+@pytest.mark.django_db
+class TestFallbackTimelineMatchesReference:
+    @pytest.mark.parametrize(("tz", "bucket_seconds", "since"), _REFERENCE_CASES)
+    @pytest.mark.parametrize("include_events", [False, True])
+    def test_groups_match_reference(self, tz, bucket_seconds, since, include_events):
+        selected_timezone = ZoneInfo(tz)
+        contract = TrackedContractFactory(owner=UserFactory())
+        rows = [
+            (since + timedelta(minutes=minutes), ("mint", "burn", "transfer")[index % 3])
+            for index, minutes in enumerate(range(0, 2 * 24 * 60, 13))
+        ]
+        ContractEventFactory.create_batch_bulk(
+            [
+                {"contract": contract, "event_type": event_type, "timestamp": timestamp}
+                for timestamp, event_type in rows
+            ]
+        )
+
+        expected = Counter(
+            (_reference_bucket_start(timestamp, bucket_seconds, selected_timezone).isoformat(), event_type)
+            for timestamp, event_type in rows
+        )
+
+        timeline = build_timeline(
+            contract_id=contract.contract_id,
+            bucket_seconds=bucket_seconds,
+            event_types=None,
+            since=since,
+            until=since + timedelta(days=2),
+            timezone_name=tz,
+            include_events=include_events,
+            limit_groups=1000,
+        )
+
+        actual = Counter(
+            {
+                (group.start.isoformat(), type_count.event_type): type_count.count
+                for group in timeline.groups
+                for type_count in group.event_type_counts
+            }
+        )
+        assert actual == expected
+        assert timeline.total_events == len(rows)
+
+
+@pytest.mark.postgres
+class TestPostgresBucketingMatchesReference:
+    """The database-side bucketing against the same wall-clock reference."""
+
+    @pytest.fixture(autouse=True)
+    def _no_rollup_coverage(self):
+        cache.delete(HOURLY_AGGREGATE_WATERMARK_KEY)
+        yield
+        cache.delete(HOURLY_AGGREGATE_WATERMARK_KEY)
+
+    def _seed(self, since):
+        contract = TrackedContractFactory(owner=UserFactory())
+        rows = [
+            (since + timedelta(minutes=minutes), ("mint", "burn", "transfer")[index % 3])
+            for index, minutes in enumerate(range(0, 2 * 24 * 60, 13))
+        ]
+        ContractEventFactory.create_batch_bulk(
+            [{"contract": contract, "event_type": event_type, "timestamp": timestamp} for timestamp, event_type in rows]
+        )
+        return contract, rows
+
+    def _timeline_counts(self, contract, since, bucket_seconds, tz, include_events):
+        timeline = build_timeline(
+            contract_id=contract.contract_id,
+            bucket_seconds=bucket_seconds,
+            event_types=None,
+            since=since,
+            until=since + timedelta(days=2),
+            timezone_name=tz,
+            include_events=include_events,
+            limit_groups=1000,
+        )
+        counts = Counter(
+            {
+                (group.start.isoformat(), type_count.event_type): type_count.count
+                for group in timeline.groups
+                for type_count in group.event_type_counts
+            }
+        )
+        return counts, timeline.total_events
+
+    @pytest.mark.parametrize(("tz", "bucket_seconds", "since"), _REFERENCE_CASES)
+    def test_local_bucket_epoch_matches_reference(self, tz, bucket_seconds, since):
+        contract, rows = self._seed(since)
+        selected_timezone = ZoneInfo(tz)
+
+        buckets = ContractEvent.objects.filter(contract=contract).annotate(
+            local_bucket=_LocalBucketEpoch("timestamp", timezone_name=tz, bucket_seconds=bucket_seconds)
+        )
+        for timestamp, local_bucket in buckets.values_list("timestamp", "local_bucket"):
+            expected = _reference_bucket_start(timestamp, bucket_seconds, selected_timezone)
+            assert _LOCAL_EPOCH + timedelta(seconds=local_bucket) == expected.replace(tzinfo=None), timestamp
+
+    @pytest.mark.parametrize(("tz", "bucket_seconds", "since"), _REFERENCE_CASES)
+    @pytest.mark.parametrize("include_events", [False, True])
+    def test_timeline_matches_reference(self, tz, bucket_seconds, since, include_events):
+        contract, rows = self._seed(since)
+        selected_timezone = ZoneInfo(tz)
+        expected = Counter(
+            (_reference_bucket_start(timestamp, bucket_seconds, selected_timezone).isoformat(), event_type)
+            for timestamp, event_type in rows
+        )
+
+        assert self._timeline_counts(contract, since, bucket_seconds, tz, include_events) == (expected, len(rows))
+
+    @pytest.mark.parametrize(
+        ("tz", "bucket_seconds", "since"),
+        [
+            ("UTC", 3600, datetime(2024, 2, 19, 20, 3, tzinfo=UTC)),
+            ("UTC", 86_400, datetime(2024, 2, 19, 20, 3, tzinfo=UTC)),
+            ("America/New_York", 3600, datetime(2024, 3, 9, 12, 10, tzinfo=UTC)),  # spans DST start
+            ("America/New_York", 3600, datetime(2024, 11, 2, 12, 10, tzinfo=UTC)),  # repeated 01:00 hour
+            ("Europe/Berlin", 7200, datetime(2024, 10, 26, 0, 30, tzinfo=UTC)),  # spans DST end
+            ("Europe/Berlin", 86_400, datetime(2024, 3, 30, 0, 30, tzinfo=UTC)),
+        ],
+    )
+    @pytest.mark.parametrize("include_events", [False, True])
+    def test_rollup_and_raw_merge_matches_reference(self, tz, bucket_seconds, since, include_events):
+        contract, rows = self._seed(since)
+        refresh_contract_event_hourly()
+        assert _aggregate_source(
+            since=since, until=since + timedelta(days=2), bucket_seconds=bucket_seconds, selected_timezone=ZoneInfo(tz)
+        )
+        # Backfilled after the refresh: below the watermark, past the rollup's cursor.
+        backfill = [(since + timedelta(hours=hours, minutes=7), "burn") for hours in (1, 5, 30)]
+        ContractEventFactory.create_batch_bulk(
+            [{"contract": contract, "event_type": event_type, "timestamp": timestamp} for timestamp, event_type in backfill]
+        )
+        rows += backfill
+        selected_timezone = ZoneInfo(tz)
+        expected = Counter(
+            (_reference_bucket_start(timestamp, bucket_seconds, selected_timezone).isoformat(), event_type)
+            for timestamp, event_type in rows
+        )
+
+        assert self._timeline_counts(contract, since, bucket_seconds, tz, include_events) == (expected, len(rows))
+
+
+class TestResolveTz:
+    def test_returns_cached_zone(self):
+        assert resolve_tz("Europe/Berlin") is resolve_tz("Europe/Berlin")
+
+    def test_unknown_zone_raises_every_time(self):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unsupported timezone"):
+                resolve_tz("Mars/Olympus_Mons")
+
+    @pytest.mark.parametrize("name", ["", "../etc/localtime", "/UTC", "A" * 300])
+    def test_malformed_zone_raises_value_error(self, name):
+        with pytest.raises(ValueError, match="Unsupported timezone"):
+            resolve_tz(name)
+
+    def test_warm_cache_loads_zones_and_skips_unknown(self):
+        resolve_tz.cache_clear()
+        warm_timezone_cache(["UTC", "Mars/Olympus_Mons", "Asia/Tokyo"])
+
+        misses = resolve_tz.cache_info().misses
+        assert resolve_tz("Asia/Tokyo") is ZoneInfo("Asia/Tokyo")
+        assert resolve_tz.cache_info().misses == misses
+
+
+class TestGroupEvents:
+    def test_groups_newest_first_input_into_runs(self):
+        base = datetime(2024, 2, 19, 20, 0, tzinfo=UTC)
+        events = [
+            SimpleNamespace(timestamp=base + timedelta(minutes=7), event_type="burn", event_index=0),
+            SimpleNamespace(timestamp=base + timedelta(minutes=2), event_type="mint", event_index=1),
+            SimpleNamespace(timestamp=base + timedelta(minutes=1), event_type="mint", event_index=0),
+        ]
+
+        groups = _group_events(
+            events=events,
+            bucket_seconds=300,
+            bucket_start_for=lambda ts: floor_bucket_start(
+                timestamp=ts, bucket_seconds=300, selected_timezone=ZoneInfo("UTC")
+            ),
+        )
+
+        assert [group.start for group in groups] == [base + timedelta(minutes=5), base]
+        assert groups[1].event_count == 2
+        assert groups[1].event_type_counts == {"mint": 2}
+        assert [event.event_index for event in groups[1].events] == [1, 0]
+
+
+@pytest.mark.django_db
+class TestAggregatedCountsMatchEventGrouping:
+    @pytest.mark.parametrize("bucket_seconds", [300, 1800, 3600, 5_400, 86_400])
+    @pytest.mark.parametrize("tz", ["UTC", "Asia/Kolkata", "America/New_York"])
+    @pytest.mark.parametrize("event_types", [None, ["mint", "transfer"]])
+    def test_counts_match(self, bucket_seconds, tz, event_types):
+        contract = TrackedContractFactory(owner=UserFactory())
+        base = datetime(2024, 3, 9, 22, 0, tzinfo=UTC)
+        ContractEventFactory.create_batch_bulk(
+            [
+                {
+                    "contract": contract,
+                    "event_type": ("mint", "burn", "transfer")[minutes % 3],
+                    "timestamp": base + timedelta(minutes=minutes),
+                }
+                for minutes in range(0, 48 * 60, 97)
+            ]
+        )
+
+        def summarize(include_events):
+            timeline = build_timeline(
+                contract_id=contract.contract_id,
+                bucket_seconds=bucket_seconds,
+                event_types=event_types,
+                since=base,
+                until=base + timedelta(days=2),
+                timezone_name=tz,
+                include_events=include_events,
+            )
+            return timeline.total_events, [
+                (group.start, group.end, group.event_count, group.event_type_counts)
+                for group in timeline.groups
+            ]
+
+        assert summarize(include_events=False) == summarize(include_events=True)
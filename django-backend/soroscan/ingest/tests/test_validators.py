@@ -0,0 +1,23 @@
+"""
+Tests for the cached JSON Schema validators.
+"""
+import jsonschema
+import pytest
+
+from soroscan.ingest.validators import get_validator
+
+
+def test_validator_is_reused_for_equal_schemas():
+    first = get_validator({"type": "object", "required": ["a"]})
+    second = get_validator({"required": ["a"], "type": "object"})
+    assert first is second
+
+
+def test_validator_rejects_invalid_payload():
+    with pytest.raises(jsonschema.ValidationError):
+        get_validator({"type": "object", "required": ["a"]}).validate({})
+
+
+def test_invalid_schema_raises_schema_error():
+    with pytest.raises(jsonschema.SchemaError):
+        get_validator({"type": "not-a-type"})
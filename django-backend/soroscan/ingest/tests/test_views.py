@@ -1,13 +1,21 @@
+import gzip
+import io
+import json
+from unittest.mock import patch
+
 import pytest
 import responses
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.urls import reverse
+from django.urls import resolve, reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from soroscan.ingest.models import (
+    ArchivedEventBatch,
+    ContractEvent,
+    DataRetentionPolicy,
     Organization,
     OrganizationMembership,
     Team,
@@ -15,6 +23,7 @@ from soroscan.ingest.models import (
     TrackedContract,
     WebhookSubscription,
 )
+from soroscan.ingest.views import restore_archived_events
 
 from .factories import (
     ContractEventFactory,
@@ -224,6 +233,37 @@ class TestContractEventViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
+    def test_restore_archive_route_is_not_shadowed_by_event_detail(self):
+        assert resolve(reverse("restore-archive")).func is restore_archived_events
+        assert resolve(reverse("event-search")).url_name == "event-search"
+        assert resolve(reverse("event-detail", args=[1])).url_name == "event-detail"
+
+    def test_restore_archive_skips_rows_with_invalid_payload_hash(self, authenticated_client, contract):
+        policy = DataRetentionPolicy.objects.create(contract=contract, s3_bucket="archive")
+        batch = ArchivedEventBatch.objects.create(policy=policy, s3_key="batch-1.json.gz", event_count=2)
+        rows = [
+            {
+                "contract__contract_id": contract.contract_id,
+                "ledger": 100,
+                "event_index": index,
+                "event_type": "transfer",
+                "payload": {},
+                "payload_hash": payload_hash,
+                "timestamp": "2024-01-01T00:00:00+00:00",
+            }
+            for index, payload_hash in enumerate(["abc", "a" * 64])
+        ]
+        body = io.BytesIO(gzip.compress(json.dumps(rows).encode()))
+
+        with patch("boto3.client") as client:
+            client.return_value.get_object.return_value = {"Body": body}
+            response = authenticated_client.post(reverse("restore-archive"), {"batch_id": batch.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["restored_count"] == 1
+        assert response.data["skipped_count"] == 1
+        assert list(ContractEvent.objects.values_list("event_index", flat=True)) == [1]
+
     def test_list_events_unauthorized(self, api_client):
         url = reverse("event-list")
         response = api_client.get(url)
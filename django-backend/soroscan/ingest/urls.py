@@ -1,8 +1,7 @@
 """
 URL patterns for SoroScan ingest API.
 """
-from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from django.urls import path
 
 from .views import (
     APIKeyViewSet,
@@ -22,15 +21,56 @@ from .views import (
     transaction_events_view,
 )
 
-router = DefaultRouter()
-router.register(r"contracts", TrackedContractViewSet, basename="contract")
-router.register(r"events", ContractEventViewSet, basename="event")
-router.register(r"invocations", ContractInvocationViewSet, basename="invocation")
-router.register(r"webhooks", WebhookSubscriptionViewSet, basename="webhook")
-router.register(r"api-keys", APIKeyViewSet, basename="apikey")
-router.register(r"teams", TeamViewSet, basename="team")
+# ViewSets are bound explicitly instead of through a DRF router: every route
+# is a plain ``path()`` (no regex patterns, format-suffix duplicates or API
+# root view), and fixed segments such as ``events/search/`` are listed
+# before the ``<pk>`` routes they would otherwise be shadowed by.
+_READ = {"get": "list"}
+_READ_DETAIL = {"get": "retrieve"}
+_WRITE = {"get": "list", "post": "create"}
+_WRITE_DETAIL = {"get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy"}
+
+contract_list = TrackedContractViewSet.as_view(_WRITE, basename="contract", detail=False)
+contract_detail = TrackedContractViewSet.as_view(_WRITE_DETAIL, basename="contract", detail=True)
+contract_completeness_dashboard = TrackedContractViewSet.as_view(
+    {"get": "completeness_dashboard"}, basename="contract", detail=False
+)
+contract_completeness = TrackedContractViewSet.as_view({"get": "completeness"}, basename="contract", detail=True)
+contract_events = TrackedContractViewSet.as_view({"get": "events"}, basename="contract", detail=True)
+contract_stats = TrackedContractViewSet.as_view({"get": "stats"}, basename="contract", detail=True)
+
+event_list = ContractEventViewSet.as_view(_READ, basename="event", detail=False)
+event_detail = ContractEventViewSet.as_view(_READ_DETAIL, basename="event", detail=True)
+event_search = ContractEventViewSet.as_view({"get": "search"}, basename="event", detail=False)
+
+invocation_list = ContractInvocationViewSet.as_view(_READ, basename="invocation", detail=False)
+invocation_detail = ContractInvocationViewSet.as_view(_READ_DETAIL, basename="invocation", detail=True)
+
+webhook_list = WebhookSubscriptionViewSet.as_view(_WRITE, basename="webhook", detail=False)
+webhook_detail = WebhookSubscriptionViewSet.as_view(_WRITE_DETAIL, basename="webhook", detail=True)
+webhook_dry_run = WebhookSubscriptionViewSet.as_view({"post": "dry_run"}, basename="webhook", detail=True)
+webhook_test = WebhookSubscriptionViewSet.as_view({"post": "test"}, basename="webhook", detail=True)
+
+apikey_list = APIKeyViewSet.as_view(_WRITE, basename="apikey", detail=False)
+apikey_detail = APIKeyViewSet.as_view(_WRITE_DETAIL, basename="apikey", detail=True)
+
+team_list = TeamViewSet.as_view(_WRITE, basename="team", detail=False)
+team_detail = TeamViewSet.as_view(_WRITE_DETAIL, basename="team", detail=True)
+team_members = TeamViewSet.as_view({"post": "members"}, basename="team", detail=True)
 
 urlpatterns = [
+    path("record/", record_event_view, name="record-event"),
+    path("health/", health_check, name="health-check"),
+    path("contracts/", contract_list, name="contract-list"),
+    path(
+        "contracts/completeness_dashboard/",
+        contract_completeness_dashboard,
+        name="contract-completeness-dashboard",
+    ),
+    path("contracts/<str:pk>/", contract_detail, name="contract-detail"),
+    path("contracts/<str:pk>/completeness/", contract_completeness, name="contract-completeness"),
+    path("contracts/<str:pk>/events/", contract_events, name="contract-events"),
+    path("contracts/<str:pk>/stats/", contract_stats, name="contract-stats"),
     path("contracts/<str:contract_id>/timeline/", contract_timeline_view, name="contract-timeline"),
     path(
         "contracts/<str:contract_id>/events/explorer/",
@@ -42,11 +82,22 @@ urlpatterns = [
         contract_event_types_view,
         name="contract-event-types",
     ),
-    path("transactions/<str:tx_id>/", transaction_events_view, name="transaction-events"),
-    path("", include(router.urls)),
-    path("record/", record_event_view, name="record-event"),
-    path("health/", health_check, name="health-check"),
+    path("events/", event_list, name="event-list"),
+    path("events/search/", event_search, name="event-search"),
     path("events/restore-archive/", restore_archived_events, name="restore-archive"),
+    path("events/<str:pk>/", event_detail, name="event-detail"),
+    path("invocations/", invocation_list, name="invocation-list"),
+    path("invocations/<str:pk>/", invocation_detail, name="invocation-detail"),
+    path("webhooks/", webhook_list, name="webhook-list"),
+    path("webhooks/<str:pk>/", webhook_detail, name="webhook-detail"),
+    path("webhooks/<str:pk>/dry-run/", webhook_dry_run, name="webhook-dry-run"),
+    path("webhooks/<str:pk>/test/", webhook_test, name="webhook-test"),
+    path("api-keys/", apikey_list, name="apikey-list"),
+    path("api-keys/<str:pk>/", apikey_detail, name="apikey-detail"),
+    path("teams/", team_list, name="team-list"),
+    path("teams/<str:pk>/", team_detail, name="team-detail"),
+    path("teams/<str:pk>/members/", team_members, name="team-members"),
+    path("transactions/<str:tx_id>/", transaction_events_view, name="transaction-events"),
     path("audit-trail/", audit_trail_view, name="audit-trail"),
     path("admin/ingest-errors/", admin_ingest_errors_view, name="admin-ingest-errors"),
 ]
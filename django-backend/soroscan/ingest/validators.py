@@ -0,0 +1,34 @@
+"""
+Cached JSON Schema validators for ingest-time payload validation.
+
+``jsonschema.validate`` re-checks the schema against its meta-schema and
+builds a fresh validator on every call, which dominates the cost of
+validating small event payloads.  Validators here are built once per
+distinct schema and reused.
+"""
+import json
+from functools import lru_cache
+from typing import Any
+
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+
+@lru_cache(maxsize=512)
+def _compile(schema_json: str) -> Validator:
+    schema = json.loads(schema_json)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def get_validator(schema: dict[str, Any]) -> Validator:
+    """
+    Return a checked, reusable validator for ``schema``.
+
+    Validators are keyed on the schema's canonical JSON rather than on a
+    model id, so an edited ``EventSchema`` or ``TrackedContract.json_schema``
+    picks up a fresh validator in every worker without cross-process
+    invalidation.  Raises :class:`jsonschema.SchemaError` for invalid schemas.
+    """
+    return _compile(json.dumps(schema, sort_keys=True))
@@ -9,6 +9,7 @@ import time
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db.models import Count, Max, Min, Q
 from django.db.models.functions import Cast
 from django.shortcuts import get_object_or_404, redirect
@@ -39,6 +40,7 @@ from .models import (
     TeamMembership,
     TrackedContract,
     WebhookSubscription,
+    validate_hex_digest,
 )
 from .serializers import (
     APIKeySerializer,
@@ -874,6 +876,7 @@ def contract_event_types_view(request, contract_id: str):
             fields={
                 "status": serializers.CharField(),
                 "restored_count": serializers.IntegerField(),
+                "skipped_count": serializers.IntegerField(),
                 "batch_id": serializers.IntegerField(),
             },
         ),
@@ -934,7 +937,15 @@ def restore_archived_events(request):
         )
 
     restored_count = 0
+    skipped_count = 0
     for row in rows:
+        payload_hash = row.get("payload_hash") or ""
+        try:
+            validate_hex_digest(payload_hash)
+        except ValidationError:
+            skipped_count += 1
+            logger.warning("Skipped row with invalid payload_hash during restore: %s", row.get("id"))
+            continue
         try:
             contract = TrackedContract.objects.get(contract_id=row["contract__contract_id"])
             ContractEvent.objects.get_or_create(
@@ -944,13 +955,14 @@ def restore_archived_events(request):
                 defaults={
                     "event_type": row["event_type"],
                     "payload": row["payload"],
-                    "payload_hash": row.get("payload_hash", ""),
+                    "payload_hash": payload_hash,
                     "timestamp": row["timestamp"],
                     "tx_hash": row.get("tx_hash", ""),
                 },
             )
             restored_count += 1
         except Exception:
+            skipped_count += 1
             logger.warning("Skipped row during restore: %s", row.get("id"), exc_info=True)
 
     batch.status = ArchivedEventBatch.STATUS_RESTORED
@@ -967,7 +979,12 @@ def restore_archived_events(request):
     )
 
     return Response(
-        {"status": "restored", "restored_count": restored_count, "batch_id": batch.id},
+        {
+            "status": "restored",
+            "restored_count": restored_count,
+            "skipped_count": skipped_count,
+            "batch_id": batch.id,
+        },
         status=status.HTTP_200_OK,
     )
 
@@ -150,6 +150,9 @@ CACHES = {
 }
 # TTL for REST/GraphQL search, stats, and timeline responses (seconds)
 QUERY_CACHE_TTL_SECONDS = env.int("QUERY_CACHE_TTL_SECONDS", default=60)
+# How far behind "now" events may still be ingested; timeline aggregate views
+# are only trusted for slots older than this, newer ones are counted raw.
+AGGREGATE_WATERMARK_GRACE_SECONDS = env.int("AGGREGATE_WATERMARK_GRACE_SECONDS", default=600)
 
 # Rate limiting configuration (via environment variables)
 RATE_LIMIT_ANON = env("RATE_LIMIT_ANON", default="60/minute")
@@ -260,6 +263,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "ingest.tasks.aggregate_event_statistics",
         "schedule": 3600,  # hourly
     },
+    "refresh-contract-event-hourly": {
+        "task": "ingest.tasks.refresh_contract_event_hourly",
+        "schedule": 300,  # every 5 minutes
+    },
     "reconcile-event-completeness": {
         "task": "ingest.tasks.reconcile_event_completeness",
         "schedule": 300,  # every 5 minutes
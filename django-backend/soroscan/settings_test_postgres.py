@@ -0,0 +1,11 @@
+"""
+Test settings for the PostgreSQL-only tests (``pytest -m postgres``).
+
+Identical to ``settings_test`` except that the database comes from
+``DATABASE_URL``, which must point at a PostgreSQL server.
+"""
+import environ
+
+from .settings_test import *  # noqa: F401,F403
+
+DATABASES = {"default": environ.Env().db("DATABASE_URL")}